@@ -0,0 +1,30 @@
+"""add latitude/longitude index to locations
+
+Revision ID: 3f9c2a7d41b8
+Revises: 44bbe95fe9a0
+Create Date: 2026-10-15 23:05:12.418302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a7d41b8"
+down_revision: Union[str, Sequence[str], None] = "44bbe95fe9a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for bounding-box lookups."""
+    op.create_index(
+        "idx_location_lat_lon", "locations", ["latitude", "longitude"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove composite latitude/longitude index."""
+    op.drop_index("idx_location_lat_lon", table_name="locations")
@@ -0,0 +1,63 @@
+"""add unique warning number per department
+
+Revision ID: 5d7a0e3c8b19
+Revises: c4d81a2e9f36
+Create Date: 2026-10-16 00:21:46.093415
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d7a0e3c8b19"
+down_revision: Union[str, Sequence[str], None] = "c4d81a2e9f36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add unique index used as the warning upsert conflict target."""
+    conn = op.get_bind()
+
+    # Geometries reference warnings (PostgreSQL only); point them at the
+    # newest duplicate before the older ones are removed
+    if sa.inspect(conn).has_table("warning_geometries"):
+        op.execute(
+            """
+            UPDATE warning_geometries
+            SET warning_id = (
+                SELECT MAX(k.id)
+                FROM warnings w
+                JOIN warnings k
+                  ON k.warning_number = w.warning_number
+                 AND k.department = w.department
+                WHERE w.id = warning_geometries.warning_id
+            )
+            """
+        )
+
+    # Keep the newest row of any duplicates saved before the upsert
+    op.execute(
+        """
+        DELETE FROM warnings
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM warnings GROUP BY warning_number, department
+        )
+        """
+    )
+
+    op.create_index(
+        "uq_warning_number_department",
+        "warnings",
+        ["warning_number", "department"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Remove unique warning number per department index."""
+    op.drop_index("uq_warning_number_department", table_name="warnings")
@@ -0,0 +1,34 @@
+"""add latest forecast index
+
+Revision ID: 9b2e6c1f5a07
+Revises: 3f9c2a7d41b8
+Create Date: 2026-10-15 23:41:37.205118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2e6c1f5a07"
+down_revision: Union[str, Sequence[str], None] = "3f9c2a7d41b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add index for latest forecast per location and date."""
+    op.create_index(
+        "idx_forecast_latest",
+        "forecasts",
+        ["location_id", "forecast_date", sa.text("scraped_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove latest forecast index."""
+    op.drop_index("idx_forecast_latest", table_name="forecasts")
@@ -0,0 +1,33 @@
+"""add issued_at/location_id index to forecasts
+
+Revision ID: a81f4c6d2e50
+Revises: 5d7a0e3c8b19
+Create Date: 2026-10-16 00:34:12.557820
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a81f4c6d2e50"
+down_revision: Union[str, Sequence[str], None] = "5d7a0e3c8b19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for issue date lookups by location."""
+    op.create_index(
+        "idx_forecast_issued_location",
+        "forecasts",
+        ["issued_at", "location_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove issued_at/location_id index."""
+    op.drop_index("idx_forecast_issued_location", table_name="forecasts")
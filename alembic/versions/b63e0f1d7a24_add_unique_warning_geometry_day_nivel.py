@@ -0,0 +1,59 @@
+"""add unique warning_number/day_number/nivel index to warning geometries
+
+Revision ID: b63e0f1d7a24
+Revises: e2b7d94a1c63
+Create Date: 2026-10-16 01:47:05.902611
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b63e0f1d7a24"
+down_revision: Union[str, Sequence[str], None] = "e2b7d94a1c63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add unique index used as the geometry upsert conflict target."""
+    conn = op.get_bind()
+
+    # warning_geometries only exists on PostgreSQL
+    if conn.dialect.name == "postgresql":
+        # Keep the newest row of any duplicates left by earlier syncs
+        op.execute(
+            """
+            DELETE FROM warning_geometries a
+            USING warning_geometries b
+            WHERE a.warning_number = b.warning_number
+              AND a.day_number = b.day_number
+              AND a.nivel IS NOT DISTINCT FROM b.nivel
+              AND a.id < b.id
+            """
+        )
+        op.create_index(
+            "uq_warning_geometry_number_day_nivel",
+            "warning_geometries",
+            ["warning_number", "day_number", "nivel"],
+            unique=True,
+        )
+        print("✓ Added unique index to warning_geometries")
+    else:
+        print("⊘ Skipping (SQLite)")
+
+
+def downgrade() -> None:
+    """Remove unique warning geometry index."""
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        op.drop_index(
+            "uq_warning_geometry_number_day_nivel", table_name="warning_geometries"
+        )
+        print("✓ Removed unique index")
+    else:
+        print("⊘ Skipping (SQLite)")
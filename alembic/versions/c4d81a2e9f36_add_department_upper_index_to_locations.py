@@ -0,0 +1,34 @@
+"""add upper(department) index to locations
+
+Revision ID: c4d81a2e9f36
+Revises: 9b2e6c1f5a07
+Create Date: 2026-10-15 23:58:04.611930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d81a2e9f36"
+down_revision: Union[str, Sequence[str], None] = "9b2e6c1f5a07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add functional index for case-insensitive department lookups."""
+    op.create_index(
+        "idx_location_department_upper",
+        "locations",
+        [sa.text("upper(department)")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove upper(department) index."""
+    op.drop_index("idx_location_department_upper", table_name="locations")
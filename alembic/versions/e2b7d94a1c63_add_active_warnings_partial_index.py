@@ -0,0 +1,38 @@
+"""add partial index for active warnings
+
+Revision ID: e2b7d94a1c63
+Revises: a81f4c6d2e50
+Create Date: 2026-10-16 01:12:40.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7d94a1c63"
+down_revision: Union[str, Sequence[str], None] = "a81f4c6d2e50"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_WHERE = sa.text("status IN ('emitido', 'vigente')")
+
+
+def upgrade() -> None:
+    """Add partial status/valid_until index for active warning lookups."""
+    op.create_index(
+        "idx_warning_active",
+        "warnings",
+        ["status", "valid_until"],
+        unique=False,
+        postgresql_where=ACTIVE_WHERE,
+        sqlite_where=ACTIVE_WHERE,
+    )
+
+
+def downgrade() -> None:
+    """Remove active warnings partial index."""
+    op.drop_index("idx_warning_active", table_name="warnings")
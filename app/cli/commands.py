@@ -161,13 +161,12 @@ def list_locations(
     """List all locations in database."""
     service = get_service()
     try:
-        locations = service.get_all_locations(active_only=active_only)
-
         if department:
-            dept_filter = department.upper()
-            locations = [
-                loc for loc in locations if loc.department.upper() == dept_filter
-            ]
+            locations = service.get_locations_by_department(
+                department, active_only=active_only
+            )
+        else:
+            locations = service.get_all_locations(active_only=active_only)
 
         if not locations:
             console.print("[yellow]No locations found in database.[/yellow]")
@@ -750,7 +749,7 @@ def geo_sync(
     from shapely.geometry import MultiPolygon
     from app.scrapers.shapefile_downloader import ShapefileDownloader
     from app.scrapers.shapefile_parser import ShapefileParser
-    from app.storage.geo_crud import save_warning_geometry
+    from app.storage.geo_crud import save_warning_geometries
     from app.storage.geo_models import WarningGeometry  # 🆕
 
     db = SessionLocal()
@@ -790,20 +789,24 @@ def geo_sync(
         console.print(f"[dim]Days: {num_days}[/dim]\n")
 
         synced = 0
-        total_saved = 0
+        records = []
 
-        for day in range(1, num_days + 1):
-            zip_path = (
-                downloader.download_dir
-                / f"warning_{warning_number}_day_{day}_{year}.zip"
-            )
+        zip_paths = {
+            day: downloader.download_dir
+            / f"warning_{warning_number}_day_{day}_{year}.zip"
+            for day in range(1, num_days + 1)
+        }
+        existing = [path for path in zip_paths.values() if path.exists()]
 
-            if not zip_path.exists():
+        # Parse geometries in parallel (each is a list of dicts with nivel)
+        parsed = dict(zip(existing, parser.parse_many(existing)))
+
+        for day, zip_path in zip_paths.items():
+            if zip_path not in parsed:
                 console.print(f"  [yellow]Day {day}: Shapefile not found[/yellow]")
                 continue
 
-            # Parse geometry (returns list of dicts with nivel)
-            polygons = parser.parse_shapefile_zip(zip_path)
+            polygons = parsed[zip_path]
 
             if not polygons:
                 console.print(f"  [red]✗ Day {day}: Failed to parse[/red]")
@@ -830,26 +833,27 @@ def geo_sync(
                     else:
                         all_polys.append(mp)
 
-                combined_mp = MultiPolygon(all_polys)
-
-                save_warning_geometry(
-                    db,
-                    warning_id=warning.id,
-                    warning_number=warning_number,
-                    day_number=day,
-                    geometry=combined_mp,
-                    nivel=nivel,
-                    shapefile_url=url,
-                    shapefile_path=zip_path,
+                records.append(
+                    {
+                        "warning_id": warning.id,
+                        "warning_number": warning_number,
+                        "day_number": day,
+                        "geometry": MultiPolygon(all_polys),
+                        "nivel": nivel,
+                        "shapefile_url": url,
+                        "shapefile_path": zip_path,
+                    }
                 )
                 saved_count += 1
 
-            total_saved += saved_count
             synced += 1
             console.print(
                 f"  [green]✓ Day {day}: Synced {saved_count} nivel(s) ({len(polygons)} polygons total)[/green]"
             )
 
+        # Save every day and nivel in one upsert
+        total_saved = save_warning_geometries(db, records)
+
         console.print(
             f"\n[green]Synced {total_saved} geometry record(s) across {synced}/{num_days} day(s)[/green]\n"
         )
@@ -897,6 +901,24 @@ def geo_list():
     console.print()
 
 
+@geo_app.command(name="boundaries")
+def geo_boundaries():
+    """Prebuild department boundaries GeoJSON for the web map."""
+    from app.services.boundaries_service import BoundariesService
+
+    service = BoundariesService()
+    path = service.build_geojson_cache()
+
+    if path is None:
+        console.print(
+            f"[red]Boundaries shapefile not found: {service.DEPARTMENTS_PATH}[/red]"
+        )
+        raise typer.Exit(1)
+
+    size_kb = path.stat().st_size / 1024
+    console.print(f"[green]✓ Wrote {path} ({size_kb:.1f} KB)[/green]")
+
+
 @geo_app.command(name="status")
 def geo_status():
     """Show geospatial backend information."""
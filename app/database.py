@@ -1,19 +1,55 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from config.settings import settings
 
+# PostgreSQL: a pool large enough for concurrent web requests, checking
+# connections before use and recycling them before server-side timeouts
+_pool_options = (
+    {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    if settings.is_postgresql
+    else {}
+)
+
 # Use effective database URL (PostgreSQL if configured, SQLite otherwise)
 engine = create_engine(
     settings.get_effective_database_url(),
     echo=settings.db_echo,
     # SQLite specific: allow same thread access
     connect_args={"check_same_thread": False} if not settings.is_postgresql else {},
+    **_pool_options,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
+
+
+@contextmanager
+def scrape_transaction(db: Session) -> Iterator[Session]:
+    """
+    Run a bulk scrape write as one transaction, committed once at the end.
+
+    CRUD helpers called with commit=False inside the block leave committing
+    to it. On PostgreSQL the commit skips waiting for the WAL flush; a crash
+    can lose only the last scrape, which the next run re-fetches.
+    """
+    try:
+        if settings.is_postgresql:
+            db.execute(text("SET LOCAL synchronous_commit = OFF"))
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
@@ -7,55 +7,70 @@ from loguru import logger
 
 from config.settings import settings
 
+# Handlers are process-wide in loguru, so they must only be registered once
+_configured = False
+
+
+def _default_module_name(record: dict) -> None:
+    """Fall back to the Python module name when no module_name was bound."""
+    record["extra"].setdefault("module", record["name"])
+
 
 def setup_logging(module_name: str | None = None) -> "logger":
     """
     Configure and return a logger instance.
 
+    Handlers are only registered on the first call; later calls just return
+    a logger bound to the given module name.
+
     Args:
         module_name: Optional module name for contextualized logging
 
     Returns:
         Configured logger instance
     """
-    # Remove default handler
-    logger.remove()
+    global _configured
 
-    # Console handler with colors
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-        "<level>{message}</level>"
-    )
+    if not _configured:
+        # Remove default handler
+        logger.remove()
+        logger.configure(patcher=_default_module_name)
 
-    if module_name:
-        log_format = log_format.replace(
-            "<cyan>{name}</cyan>", f"<cyan>{module_name}</cyan>"
+        # Console handler with colors
+        log_format = (
+            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+            "<level>{level: <8}</level> | "
+            "<cyan>{extra[module]}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+            "<level>{message}</level>"
         )
 
-    # Add console handler
-    logger.add(
-        sys.stderr,
-        format=log_format,
-        level="DEBUG" if settings.debug else "INFO",
-        colorize=True,
-    )
-
-    # Add file handler if log file is configured
-    if settings.log_file:
-        log_path = Path(settings.log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
+        # Add console handler
         logger.add(
-            settings.log_file,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+            sys.stderr,
+            format=log_format,
             level="DEBUG" if settings.debug else "INFO",
-            rotation="10 MB",
-            retention="30 days",
-            compression="zip",
+            colorize=True,
         )
 
+        # Add file handler if log file is configured
+        if settings.log_file:
+            log_path = Path(settings.log_file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+
+            logger.add(
+                settings.log_file,
+                format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+                level="DEBUG" if settings.debug else "INFO",
+                rotation="10 MB",
+                retention="30 days",
+                compression="zip",
+            )
+
+        _configured = True
+
+    if module_name:
+        return logger.bind(module=module_name)
+
     return logger
 
 
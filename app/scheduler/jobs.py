@@ -184,7 +184,7 @@ def run_shapefile_download_job() -> None:
         from app.storage.geo_models import WarningGeometry
         from app.scrapers.shapefile_downloader import ShapefileDownloader
         from app.scrapers.shapefile_parser import ShapefileParser
-        from app.storage.geo_crud import save_warning_geometry
+        from app.storage.geo_crud import save_warning_geometries
         from shapely.geometry import MultiPolygon
 
         # Get active warnings (vigente or emitido)
@@ -252,19 +252,20 @@ def run_shapefile_download_job() -> None:
                     continue
 
                 # Parse and sync geometries
-                total_polygons = 0
+                zip_paths = {}
                 for day in range(1, num_days + 1):
                     zip_path = (
                         downloader.download_dir
                         / f"warning_{warning_number}_day_{day}_{year}.zip"
                     )
+                    if zip_path.exists():
+                        zip_paths[day] = zip_path
 
-                    if not zip_path.exists():
-                        continue
-
-                    # Parse polygons
-                    polygons = parser.parse_shapefile_zip(zip_path)
+                # Parse all days in parallel
+                parsed = parser.parse_many(list(zip_paths.values()))
+                records = []
 
+                for (day, zip_path), polygons in zip(zip_paths.items(), parsed):
                     if not polygons:
                         logger.warning(f"  Day {day}: Failed to parse")
                         continue
@@ -287,19 +288,20 @@ def run_shapefile_download_job() -> None:
                             else:
                                 all_polys.append(mp)
 
-                        combined_mp = MultiPolygon(all_polys)
-
-                        save_warning_geometry(
-                            db,
-                            warning_id=warning.id,
-                            warning_number=warning_number,
-                            day_number=day,
-                            geometry=combined_mp,
-                            nivel=nivel,
-                            shapefile_url=url,
-                            shapefile_path=zip_path,
+                        records.append(
+                            {
+                                "warning_id": warning.id,
+                                "warning_number": warning_number,
+                                "day_number": day,
+                                "geometry": MultiPolygon(all_polys),
+                                "nivel": nivel,
+                                "shapefile_url": url,
+                                "shapefile_path": zip_path,
+                            }
                         )
-                        total_polygons += 1
+
+                # Save every day and nivel in one upsert
+                total_polygons = save_warning_geometries(db, records)
 
                 if total_polygons > 0:
                     logger.info(f"  Synced {total_polygons} geometry record(s)")
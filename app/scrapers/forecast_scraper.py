@@ -2,67 +2,100 @@ import re
 import time
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 
 from config.settings import settings
 from app.models.forecast import DailyForecast, LocationForecast
-from app.scrapers.utils import parse_date, parse_temperature, parse_issued_date
+from app.scrapers.utils import (
+    get_session,
+    parse_date,
+    parse_issued_date,
+    parse_temperature,
+)
 
 from rich.console import Console
 
 console = Console()
 
+_ICON_RE = re.compile(r"icon(\d+)\.png")
+
+# XPath selectors are compiled once and evaluated in C by lxml
+_NAME_CITY_XPATH = etree.XPath(
+    './/span[contains(concat(" ", normalize-space(@class), " "), " nameCity ")]'
+)
+_FORECAST_ROWS_XPATH = etree.XPath('.//div[@class="row m-3"]')
+_FORECAST_COLS_XPATH = etree.XPath('.//div[contains(@class, "col-sm-")]')
+_ISSUED_TEXT_XPATH = etree.XPath(
+    '//text()[re:test(., "Emisión:", "i")]',
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+
+
+def _get_text(element) -> str:
+    """Join stripped text nodes of an element (like BeautifulSoup's strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
 
 class ForecastScraper:
     """Scraper for SENAMHI weather forecasts."""
 
+    # Reuse the parsed page when discovery and scraping run back to back
+    PAGE_CACHE_SECONDS = 60
+
     def __init__(self):
         """Initialize scraper with configuration from settings."""
         self.base_url = settings.senamhi_forecast_url
         self.timeout = settings.request_timeout
         self.user_agent = settings.user_agent
+        self.session = get_session()
+        self._page: html.HtmlElement | None = None
+        self._page_fetched_at = 0.0
 
-    def _make_request(self) -> BeautifulSoup:
+    def _make_request(self) -> html.HtmlElement:
         """Fetch and parse SENAMHI forecast page."""
-        headers = {
-            "User-Agent": self.user_agent,
-        }
-
-        response = requests.get(
-            self.base_url,
-            headers=headers,
-            timeout=self.timeout,
-        )
+        if (
+            self._page is not None
+            and time.monotonic() - self._page_fetched_at < self.PAGE_CACHE_SECONDS
+        ):
+            return self._page
+
+        response = self.session.get(self.base_url, timeout=self.timeout)
         response.raise_for_status()
 
-        return BeautifulSoup(response.content, "lxml")
+        # Honour the HTTP charset; without one lxml uses the page's <meta> tag
+        parser = None
+        if "charset" in response.headers.get("Content-Type", "").lower():
+            parser = html.HTMLParser(encoding=response.encoding)
+
+        self._page = html.fromstring(response.content, parser=parser)
+        self._page_fetched_at = time.monotonic()
+        return self._page
 
     def _parse_forecast_row(self, row_div) -> DailyForecast:
         """Parse a single day forecast from HTML row."""
-        cols = row_div.find_all("div", class_=re.compile(r"col-sm-\d+"))
+        cols = _FORECAST_COLS_XPATH(row_div)
 
         if len(cols) < 5:
             raise ValueError(f"Expected at least 5 columns, found {len(cols)}")
 
-        date_text = cols[0].get_text(strip=True)
+        date_text = _get_text(cols[0])
         date = parse_date(date_text)
 
         # Extract icon number from image src
-        img_tag = cols[1].find("img")
-        icon_url = img_tag["src"] if img_tag else ""
+        img_tag = cols[1].find(".//img")
+        icon_url = img_tag.get("src", "") if img_tag is not None else ""
 
         # Extract number from URL like: /public/images/icono/100x100/icon005.png
-        icon_match = re.search(r"icon(\d+)\.png", icon_url)
+        icon_match = _ICON_RE.search(icon_url)
         icon_number = int(icon_match.group(1)) if icon_match else 0
 
-        temp_max_text = cols[2].get_text(strip=True)
+        temp_max_text = _get_text(cols[2])
         temp_max = parse_temperature(temp_max_text)
 
-        temp_min_text = cols[3].get_text(strip=True)
+        temp_min_text = _get_text(cols[3])
         temp_min = parse_temperature(temp_min_text)
 
-        description = cols[4].get_text(strip=True)
+        description = _get_text(cols[4])
 
         return DailyForecast(
             date=date,
@@ -75,11 +108,11 @@ class ForecastScraper:
 
     def _parse_location_cell(self, cell, issued_at: datetime) -> LocationForecast:
         """Parse all forecasts for a single location from table cell."""
-        name_span = cell.find("span", class_="nameCity")
-        if not name_span:
+        name_spans = _NAME_CITY_XPATH(cell)
+        if not name_spans:
             raise ValueError("Location name not found")
 
-        full_name = name_span.get_text(strip=True)
+        full_name = _get_text(name_spans[0])
 
         # Extract department (always after last " - ")
         if " - " not in full_name:
@@ -98,7 +131,7 @@ class ForecastScraper:
             # Standard format: just the location name
             location = location_part
 
-        forecast_rows = cell.find_all("div", class_="row m-3")
+        forecast_rows = _FORECAST_ROWS_XPATH(cell)
 
         daily_forecasts = []
         for row in forecast_rows:
@@ -126,61 +159,58 @@ class ForecastScraper:
         If departments is None, uses departments from settings.
         """
         if departments is None:
-            departments = settings.get_departments_list()
-
-        departments_upper = [d.upper() for d in departments]
+            departments_upper = settings.departments_upper
+        else:
+            departments_upper = frozenset(d.upper() for d in departments)
 
-        soup = self._make_request()
+        tree = self._make_request()
 
         # Extract issued date from footer
-        issued_at = self._extract_issued_date(soup)
+        issued_at = self._extract_issued_date(tree)
 
-        table = soup.find("table")
-        if not table:
+        table = tree.find(".//table")
+        if table is None:
             raise ValueError("Forecast table not found")
 
-        rows = table.find_all("tr")
+        rows = table.iter("tr")
 
         forecasts = []
 
         for row in rows:
-            cell = row.find("td")
-            if not cell:
+            cell = row.find(".//td")
+            if cell is None:
                 continue
 
-            name_span = cell.find("span", class_="nameCity")
-            if not name_span:
+            name_spans = _NAME_CITY_XPATH(cell)
+            if not name_spans:
                 continue
 
-            full_name = name_span.get_text(strip=True)
+            full_name = _get_text(name_spans[0])
 
-            matches_department = False
-            for dept in departments_upper:
-                if f"- {dept}" in full_name.upper():
-                    matches_department = True
-                    break
-
-            if not matches_department:
+            # Department is always the token after the last " - "
+            dept_token = full_name.rsplit(" - ", 1)[-1].strip().upper()
+            if dept_token not in departments_upper:
                 continue
 
             try:
                 location_forecast = self._parse_location_cell(cell, issued_at)
                 forecasts.append(location_forecast)
 
-                time.sleep(0.1)
-
             except Exception as e:
                 print(f"Error parsing {full_name}: {e}")
                 continue
 
         return forecasts
 
-    def _extract_issued_date(self, soup: BeautifulSoup) -> datetime:
+    def _extract_issued_date(self, tree: html.HtmlElement) -> datetime:
         """Extract forecast issued date from page footer."""
 
         # Look for text containing "Emisión:"
-        for element in soup.find_all(string=re.compile(r"Emisión:", re.IGNORECASE)):
-            parent_text = element.parent.get_text(strip=True)
+        for text in _ISSUED_TEXT_XPATH(tree):
+            parent = text.getparent()
+            if text.is_tail:
+                parent = parent.getparent()
+            parent_text = _get_text(parent)
             try:
                 return parse_issued_date(parent_text)
             except ValueError:
@@ -192,31 +222,17 @@ class ForecastScraper:
 
     def get_all_departments(self) -> list[str]:
         """Discover all available departments from SENAMHI."""
-        soup = self._make_request()
+        tree = self._make_request()
 
-        table = soup.find("table")
-        if not table:
+        table = tree.find(".//table")
+        if table is None:
             raise ValueError("Forecast table not found")
 
-        rows = table.find_all("tr")
-
         departments = set()
-
-        for row in rows:
-            cell = row.find("td")
-            if not cell:
-                continue
-
-            name_span = cell.find("span", class_="nameCity")
-            if not name_span:
-                continue
-
-            full_name = name_span.get_text(strip=True)
-
-            # Extract department
+        for span in _NAME_CITY_XPATH(table):
+            full_name = _get_text(span)
             if " - " in full_name:
-                department = full_name.rsplit(" - ", 1)[1].strip()
-                departments.add(department)
+                departments.add(full_name.rsplit(" - ", 1)[1].strip())
 
         return sorted(list(departments))
 
@@ -1,21 +1,33 @@
 """Downloader for SENAMHI warning shapefiles."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-import zipfile
+import shutil
 
 import requests
 from rich.console import Console
 
+from app.scrapers.utils import get_session, zip_namelist
 from app.storage.models import WarningAlert
 from config.settings import settings
 
 console = Console()
 
+# Local file header signature that starts every ZIP archive
+ZIP_MAGIC = b"PK\x03\x04"
+COPY_BUFFER_SIZE = 1 << 20
+
 
 class ShapefileDownloader:
     """Download shapefiles for SENAMHI weather warnings."""
 
+    # Query parameters shared by every WFS shapefile request
+    _STATIC_QUERY = (
+        "service=WFS&version=1.0.0&request=GetFeature&typeName=g_aviso:view_aviso"
+        "&maxFeatures=50&outputFormat=SHAPE-ZIP"
+    )
+
     def __init__(self, download_dir: Path | None = None):
         """
         Initialize downloader.
@@ -27,6 +39,7 @@ class ShapefileDownloader:
         self.download_dir = download_dir or Path("data/shapefiles")
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.timeout = settings.request_timeout
+        self.session = get_session()
 
     def build_shapefile_url(self, warning_number: str, day: int, year: int) -> str:
         """
@@ -44,23 +57,11 @@ class ShapefileDownloader:
             >>> downloader.build_shapefile_url("418", 1, 2025)
             'https://idesep.senamhi.gob.pe/geoserver/g_aviso/ows?...'
         """
-        filename = f"shp_aviso_{warning_number}_{day}_{year}.zip"
-        viewparams = f"{warning_number}_{day}_{year}"
-
-        params = {
-            "service": "WFS",
-            "version": "1.0.0",
-            "request": "GetFeature",
-            "typeName": "g_aviso:view_aviso",
-            "format_options": f"filename:{filename}",
-            "maxFeatures": "50",
-            "viewparams": f"qry:{viewparams}",
-            "outputFormat": "SHAPE-ZIP",
-        }
-
-        # Build query string
-        query_parts = [f"{k}={v}" for k, v in params.items()]
-        return f"{self.geoserver_base}?{'&'.join(query_parts)}"
+        qry = f"{warning_number}_{day}_{year}"
+        return (
+            f"{self.geoserver_base}?{self._STATIC_QUERY}"
+            f"&format_options=filename:shp_aviso_{qry}.zip&viewparams=qry:{qry}"
+        )
 
     def calculate_warning_days(self, warning: WarningAlert) -> int:
         """
@@ -102,7 +103,7 @@ class ShapefileDownloader:
         try:
             console.print(f"  [cyan]Downloading day {day}...[/cyan]")
 
-            response = requests.get(url, timeout=self.timeout, stream=True)
+            response = self.session.get(url, timeout=self.timeout, stream=True)
             response.raise_for_status()
 
             # Check if response is actually a ZIP file
@@ -112,13 +113,25 @@ class ShapefileDownloader:
                     f"  [yellow]Warning: Unexpected content type: {content_type}[/yellow]"
                 )
 
-            # Save file
+            # GeoServer errors come back as XML/HTML, so check the ZIP magic
+            # bytes before writing anything to disk
+            response.raw.decode_content = True
+            magic = response.raw.read(len(ZIP_MAGIC))
+            if magic != ZIP_MAGIC:
+                snippet = (magic + response.raw.read(200)).decode(
+                    "utf-8", errors="replace"
+                )
+                console.print(f"  [red]Response is not a ZIP: {snippet}[/red]")
+                response.close()
+                return None
+
+            # Copy the rest of the body in C with a 1 MiB buffer
             with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                f.write(magic)
+                shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
 
-            # Verify it's a valid ZIP
-            if not zipfile.is_zipfile(filepath):
+            # Verify the central directory (catches truncated downloads)
+            if zip_namelist(filepath) is None:
                 console.print("  [red]Downloaded file is not a valid ZIP[/red]")
                 filepath.unlink()
                 return None
@@ -158,11 +171,15 @@ class ShapefileDownloader:
             f"[dim]Duration: {num_days} days ({warning.valid_from.date()} to {warning.valid_until.date()})[/dim]"
         )
 
-        downloaded = []
-        for day in range(1, num_days + 1):
-            filepath = self.download_shapefile(warning.warning_number, day, year)
-            if filepath:
-                downloaded.append(filepath)
+        # Days are independent downloads from the same host, fetch them in parallel
+        with ThreadPoolExecutor(
+            max_workers=min(settings.scrape_max_workers, num_days)
+        ) as executor:
+            results = executor.map(
+                lambda day: self.download_shapefile(warning.warning_number, day, year),
+                range(1, num_days + 1),
+            )
+            downloaded = [filepath for filepath in results if filepath]
 
         console.print(
             f"\n[green]Downloaded {len(downloaded)}/{num_days} shapefiles[/green]\n"
@@ -1,17 +1,26 @@
 """Parser for SENAMHI warning shapefiles."""
 
+import os
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import geopandas as gpd
+import pandas as pd
 from rich.console import Console
-from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry import MultiPolygon
 
+from app.scrapers.utils import zip_namelist
 from config.settings import settings
 
 console = Console()
 
 
+def _parse_shapefile_worker(zip_path: Path) -> list[dict] | None:
+    """Parse one shapefile ZIP in a worker process."""
+    return ShapefileParser().parse_shapefile_zip(zip_path)
+
+
 class ShapefileParser:
     """Parse shapefiles and extract geometries."""
 
@@ -37,7 +46,8 @@ class ShapefileParser:
 
         try:
             # Read shapefile directly from ZIP
-            gdf = gpd.read_file(f"zip://{zip_path}")
+            # pyogrio reads through GDAL in bulk, avoiding per-record overhead
+            gdf = gpd.read_file(f"zip://{zip_path}", engine="pyogrio")
 
             if gdf.empty:
                 console.print(f"[yellow]Empty shapefile: {zip_path.name}[/yellow]")
@@ -47,33 +57,28 @@ class ShapefileParser:
             if gdf.crs and gdf.crs.to_epsg() != 4326:
                 gdf = gdf.to_crs(epsg=4326)
 
-            # Extract individual polygons with their nivel
-            polygons = []
-            for idx, row in gdf.iterrows():
-                geom = row.geometry
-                if geom is None:
-                    continue
-
-                # Extract nivel (parse "Nivel 1" -> 1)
-                nivel_str = row.get("nivel", "Nivel 1")
-                try:
-                    nivel = (
-                        int(nivel_str.split()[-1])
-                        if isinstance(nivel_str, str)
-                        else int(nivel_str)
-                    )
-                except (ValueError, IndexError):
-                    nivel = 1
-
-                # Convert Polygon to MultiPolygon if needed
-                if isinstance(geom, Polygon):
-                    geom = MultiPolygon([geom])
-                elif isinstance(geom, MultiPolygon):
-                    pass  # Already MultiPolygon
-                else:
-                    continue  # Skip invalid geometries
-
-                polygons.append({"geometry": geom, "nivel": nivel})
+            # Keep only polygonal geometries (drops nulls and other types)
+            gdf = gdf[gdf.geom_type.isin(["Polygon", "MultiPolygon"])]
+
+            # Extract nivel (parse "Nivel 1" -> 1), defaulting to 1
+            if "nivel" in gdf.columns:
+                nivel = pd.to_numeric(
+                    gdf["nivel"].astype(str).str.split().str[-1], errors="coerce"
+                )
+                nivel = nivel.fillna(1).astype(int)
+            else:
+                nivel = pd.Series(1, index=gdf.index)
+
+            # Convert Polygon to MultiPolygon so every row has the same type
+            geometry = gdf.geometry.apply(
+                lambda geom: (
+                    MultiPolygon([geom]) if geom.geom_type == "Polygon" else geom
+                )
+            )
+
+            polygons = pd.DataFrame({"geometry": geometry, "nivel": nivel}).to_dict(
+                "records"
+            )
 
             if not polygons:
                 console.print(
@@ -91,6 +96,26 @@ class ShapefileParser:
             console.print(f"[red]Error parsing {zip_path.name}: {e}[/red]")
             return None
 
+    def parse_many(self, zip_paths: list[Path]) -> list[list[dict] | None]:
+        """
+        Parse several shapefile ZIPs in parallel worker processes.
+
+        Reprojection and geometry construction are CPU-bound, so a process
+        pool scales with cores where threads would contend for the GIL.
+
+        Args:
+            zip_paths: Paths to shapefile ZIP files
+
+        Returns:
+            Parse results in the same order as zip_paths
+        """
+        if len(zip_paths) < 2:
+            return [self.parse_shapefile_zip(zip_path) for zip_path in zip_paths]
+
+        max_workers = min(os.cpu_count() or 1, len(zip_paths))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_parse_shapefile_worker, zip_paths))
+
     def extract_shapefile_info(self, zip_path: Path) -> dict:
         """
         Extract metadata from shapefile without full parsing.
@@ -102,17 +127,19 @@ class ShapefileParser:
             Dict with shapefile information
         """
         try:
-            with zipfile.ZipFile(zip_path, "r") as z:
-                files = z.namelist()
-                shp_files = [f for f in files if f.endswith(".shp")]
-
-                return {
-                    "zip_name": zip_path.name,
-                    "size_kb": zip_path.stat().st_size / 1024,
-                    "files": len(files),
-                    "shp_files": len(shp_files),
-                    "has_shp": len(shp_files) > 0,
-                }
+            files = zip_namelist(zip_path)
+            if files is None:
+                raise zipfile.BadZipFile("File is not a zip file")
+
+            shp_files = [f for f in files if f.endswith(".shp")]
+
+            return {
+                "zip_name": zip_path.name,
+                "size_kb": zip_path.stat().st_size / 1024,
+                "files": len(files),
+                "shp_files": len(shp_files),
+                "has_shp": len(shp_files) > 0,
+            }
 
         except Exception as e:
             console.print(f"[red]Error reading {zip_path.name}: {e}[/red]")
@@ -131,30 +158,32 @@ class ShapefileParser:
             True if valid shapefile ZIP
         """
         try:
-            with zipfile.ZipFile(zip_path, "r") as z:
-                files = set(z.namelist())
-
-                # Check for required extensions
-                has_shp = any(f.endswith(".shp") for f in files)
-                has_shx = any(f.endswith(".shx") for f in files)
-                has_dbf = any(f.endswith(".dbf") for f in files)
-
-                is_valid = has_shp and has_shx and has_dbf
-
-                if not is_valid:
-                    missing = []
-                    if not has_shp:
-                        missing.append(".shp")
-                    if not has_shx:
-                        missing.append(".shx")
-                    if not has_dbf:
-                        missing.append(".dbf")
-
-                    console.print(
-                        f"[yellow]Invalid shapefile (missing: {', '.join(missing)})[/yellow]"
-                    )
-
-                return is_valid
+            names = zip_namelist(zip_path)
+            if names is None:
+                raise zipfile.BadZipFile("File is not a zip file")
+            files = set(names)
+
+            # Check for required extensions
+            has_shp = any(f.endswith(".shp") for f in files)
+            has_shx = any(f.endswith(".shx") for f in files)
+            has_dbf = any(f.endswith(".dbf") for f in files)
+
+            is_valid = has_shp and has_shx and has_dbf
+
+            if not is_valid:
+                missing = []
+                if not has_shp:
+                    missing.append(".shp")
+                if not has_shx:
+                    missing.append(".shx")
+                if not has_dbf:
+                    missing.append(".dbf")
+
+                console.print(
+                    f"[yellow]Invalid shapefile (missing: {', '.join(missing)})[/yellow]"
+                )
+
+            return is_valid
 
         except Exception as e:
             console.print(f"[red]Error validating {zip_path.name}: {e}[/red]")
@@ -1,10 +1,100 @@
+import atexit
 import re
+import zipfile
 from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import settings
+
+_MONTHS_ES: dict[str, int] = {
+    "enero": 1,
+    "febrero": 2,
+    "marzo": 3,
+    "abril": 4,
+    "mayo": 5,
+    "junio": 6,
+    "julio": 7,
+    "agosto": 8,
+    "septiembre": 9,
+    "octubre": 10,
+    "noviembre": 11,
+    "diciembre": 12,
+}
+
+_TEMP_RE = re.compile(r"(\d+)ºC")
+_DATE_RE = re.compile(r"(\w+),\s+(\d+)\s+de\s+(\w+)")
+_ISSUED_RE = re.compile(r"(\w+),\s+(\d+)\s+de\s+(\w+)\s+del\s+(\d{4})")
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps connections to SENAMHI alive.
+
+    The pool is sized for the concurrent scrapers so parallel requests to
+    the same host reuse connections instead of opening new ones.
+    """
+    session = requests.Session()
+    # Retry transient connection errors and gateway failures on GETs
+    retries = Retry(
+        total=settings.max_retries,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.scrape_max_workers,
+        pool_maxsize=settings.scrape_max_workers,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": settings.user_agent})
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Return the process-wide scraper session.
+
+    Scrapers are created per command or job, so sharing one session keeps
+    established TLS connections alive between them. Closed at exit.
+    """
+    session = create_session()
+    atexit.register(session.close)
+    return session
+
+
+@lru_cache(maxsize=256)
+def _read_zip_namelist(path: Path, mtime_ns: int, size: int) -> tuple[str, ...] | None:
+    """Read a ZIP central directory once per file version."""
+    try:
+        with zipfile.ZipFile(path, "r") as z:
+            return tuple(z.namelist())
+    except zipfile.BadZipFile:
+        return None
+
+
+def zip_namelist(path: Path) -> tuple[str, ...] | None:
+    """
+    Return the member names of a ZIP file, or None if it is not a valid ZIP.
+
+    Results are cached by path, modification time and size, so the
+    downloader and parser share one central-directory read per file.
+    """
+    stat = path.stat()
+    return _read_zip_namelist(path, stat.st_mtime_ns, stat.st_size)
 
 
 def parse_temperature(text: str) -> int:
     """Extract temperature value from text like '22ºC'."""
-    match = re.search(r"(\d+)ºC", text)
+    match = _TEMP_RE.search(text)
     if match:
         return int(match.group(1))
     raise ValueError(f"Cannot parse temperature from: {text}")
@@ -12,23 +102,7 @@ def parse_temperature(text: str) -> int:
 
 def parse_date(date_text: str, year: int | None = None) -> date:
     """Parse Spanish date format to date object."""
-    months_es = {
-        "enero": 1,
-        "febrero": 2,
-        "marzo": 3,
-        "abril": 4,
-        "mayo": 5,
-        "junio": 6,
-        "julio": 7,
-        "agosto": 8,
-        "septiembre": 9,
-        "octubre": 10,
-        "noviembre": 11,
-        "diciembre": 12,
-    }
-
-    pattern = r"(\w+),\s+(\d+)\s+de\s+(\w+)"
-    match = re.search(pattern, date_text.lower())
+    match = _DATE_RE.search(date_text.lower())
 
     if not match:
         raise ValueError(f"Cannot parse date from: {date_text}")
@@ -36,7 +110,7 @@ def parse_date(date_text: str, year: int | None = None) -> date:
     day = int(match.group(2))
     month_name = match.group(3)
 
-    month = months_es.get(month_name)
+    month = _MONTHS_ES.get(month_name)
     if not month:
         raise ValueError(f"Unknown month: {month_name}")
 
@@ -51,23 +125,7 @@ def parse_issued_date(issued_text: str) -> datetime:
     Parse emission date from text like 'Emisión: martes, 11 de noviembre del 2025'.
     Returns datetime with time set to midnight.
     """
-    months_es = {
-        "enero": 1,
-        "febrero": 2,
-        "marzo": 3,
-        "abril": 4,
-        "mayo": 5,
-        "junio": 6,
-        "julio": 7,
-        "agosto": 8,
-        "septiembre": 9,
-        "octubre": 10,
-        "noviembre": 11,
-        "diciembre": 12,
-    }
-
-    pattern = r"(\w+),\s+(\d+)\s+de\s+(\w+)\s+del\s+(\d{4})"
-    match = re.search(pattern, issued_text.lower())
+    match = _ISSUED_RE.search(issued_text.lower())
 
     if not match:
         raise ValueError(f"Cannot parse issued date from: {issued_text}")
@@ -76,7 +134,7 @@ def parse_issued_date(issued_text: str) -> datetime:
     month_name = match.group(3)
     year = int(match.group(4))
 
-    month = months_es.get(month_name)
+    month = _MONTHS_ES.get(month_name)
     if not month:
         raise ValueError(f"Unknown month: {month_name}")
 
@@ -1,15 +1,54 @@
 """Scraper for SENAMHI weather warnings."""
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 
-import requests
 from rich.console import Console
 
 from config.settings import settings
+from app import serialization
 from app.models.warning import Warning, WarningSeverity, WarningStatus
+from app.scrapers.utils import get_session
 
 console = Console()
 
+_COLOR_SEVERITY: dict[str, WarningSeverity] = {
+    "VERDE": WarningSeverity.GREEN,
+    "AMARILLO": WarningSeverity.YELLOW,
+    "NARANJA": WarningSeverity.ORANGE,
+    "ROJO": WarningSeverity.RED,
+}
+
+# Fallback when the API sends an unknown color
+_NIVEL_SEVERITY: dict[str, WarningSeverity] = {
+    "1": WarningSeverity.GREEN,
+    "2": WarningSeverity.YELLOW,
+    "3": WarningSeverity.ORANGE,
+    "4": WarningSeverity.RED,
+}
+
+# Forest fire avisos are not tracked; matched on the lowercased title
+_FIRE_MARKER = "incendios forestales"
+
+# Only these are kept; expired warnings are dropped after parsing
+_ACTIVE_STATUSES = frozenset({WarningStatus.VIGENTE, WarningStatus.EMITIDO})
+
+# SENAMHI datetime format: DD/MM/YYYY HH:MM:SS
+_DT_RE = re.compile(r"(\d{2})/(\d{2})/(\d{4}) (\d{2}):(\d{2}):(\d{2})")
+
+
+@lru_cache(maxsize=4096)
+def _parse_senamhi_dt(date_str: str) -> datetime:
+    """Parse DD/MM/YYYY HH:MM:SS, cached since issue dates repeat across avisos."""
+    # Precompiled pattern avoids strptime reinterpreting the format each call
+    m = _DT_RE.fullmatch(date_str)
+    if m is None:
+        return datetime.strptime(date_str, "%d/%m/%Y %H:%M:%S")
+    return datetime(int(m[3]), int(m[2]), int(m[1]), int(m[4]), int(m[5]), int(m[6]))
+
 
 class WarningScraper:
     """Scraper for SENAMHI weather warnings."""
@@ -48,38 +87,38 @@ class WarningScraper:
         self.timeout = settings.request_timeout
         self.user_agent = settings.user_agent
         self.api_base = settings.senamhi_warnings_api
+        self.session = get_session()
 
     def _parse_senamhi_datetime(self, date_str: str) -> datetime:
         """Parse SENAMHI datetime format: DD/MM/YYYY HH:MM:SS."""
-        return datetime.strptime(date_str, "%d/%m/%Y %H:%M:%S")
+        return _parse_senamhi_dt(date_str)
 
     def _map_severity(self, nivel: str, color: str) -> WarningSeverity:
         """Map severity level to enum."""
-        color_upper = color.upper()
-
-        if color_upper == "VERDE":
-            return WarningSeverity.GREEN
-        elif color_upper == "AMARILLO":
-            return WarningSeverity.YELLOW
-        elif color_upper == "NARANJA":
-            return WarningSeverity.ORANGE
-        elif color_upper == "ROJO":
-            return WarningSeverity.RED
-        else:
-            nivel_map = {
-                "1": WarningSeverity.GREEN,
-                "2": WarningSeverity.YELLOW,
-                "3": WarningSeverity.ORANGE,
-                "4": WarningSeverity.RED,
-            }
-            return nivel_map.get(str(nivel), WarningSeverity.YELLOW)
-
-    def _parse_warning(self, aviso_data: dict, department: str) -> Warning | None:
-        """Parse warning from API response."""
+        severity = _COLOR_SEVERITY.get(color.upper())
+        if severity is None:
+            severity = _NIVEL_SEVERITY.get(str(nivel), WarningSeverity.YELLOW)
+        return severity
+
+    @staticmethod
+    def _warning_status(
+        valid_from: datetime, valid_until: datetime, now: datetime
+    ) -> WarningStatus:
+        """Determine warning status from its validity window."""
+        if valid_from <= now <= valid_until:
+            return WarningStatus.VIGENTE
+        if valid_from > now:
+            return WarningStatus.EMITIDO
+        return WarningStatus.VENCIDO
+
+    def _parse_warning(
+        self, aviso_data: dict, department: str, now: datetime | None = None
+    ) -> Warning | None:
+        """Parse warning from API response, whatever its status."""
         try:
-            # Skip forest fire warnings
+            # Skip forest fire warnings before paying for any date parsing
             titulo = aviso_data["titulo"]
-            if "incendios forestales" in titulo.lower():
+            if _FIRE_MARKER in titulo.lower():
                 return None
 
             issued_at = self._parse_senamhi_datetime(aviso_data["fechaEmision"])
@@ -88,18 +127,9 @@ class WarningScraper:
 
             severity = self._map_severity(aviso_data["nivel"], aviso_data["colorNivel"])
 
-            # Determine status based on dates
-            now = datetime.now()
-            if valid_from <= now <= valid_until:
-                status = WarningStatus.VIGENTE
-            elif valid_from > now:
-                status = WarningStatus.EMITIDO
-            else:
-                status = WarningStatus.VENCIDO
-
-            # Only scrape EMITIDO and VIGENTE
-            if status == WarningStatus.VENCIDO:
-                return None
+            status = self._warning_status(
+                valid_from, valid_until, now or datetime.now()
+            )
 
             return Warning(
                 senamhi_id=aviso_data["id"],
@@ -107,7 +137,7 @@ class WarningScraper:
                 department=department,
                 severity=severity,
                 status=status,
-                title=aviso_data["titulo"],
+                title=titulo,
                 description=aviso_data["descripcion"],
                 valid_from=valid_from,
                 valid_until=valid_until,
@@ -121,31 +151,31 @@ class WarningScraper:
     def scrape_warnings_for_department(self, department: str) -> list[Warning]:
         """Scrape warnings for a specific department."""
         dept_upper = department.upper()
+        console.print(f"[dim]Scraping warnings for {department}...[/dim]")
 
-        if dept_upper not in self.DEPARTMENT_IDS:
+        dept_id = self.DEPARTMENT_IDS.get(dept_upper)
+        if dept_id is None:
             console.print(f"[yellow]Unknown department: {department}[/yellow]")
             return []
 
-        dept_id = self.DEPARTMENT_IDS[dept_upper]
         url = f"{self.api_base}/{dept_id}"
 
         try:
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            data = response.json()
+            # Parse raw bytes directly, skipping the intermediate str decode
+            data = serialization.loads(response.content)
 
             if "Avisos" not in data:
                 return []
 
-            warnings = []
-            for aviso in data["Avisos"]:
-                warning = self._parse_warning(aviso, dept_upper)
-                if warning:
-                    warnings.append(warning)
-
-            return warnings
+            # Only scrape EMITIDO and VIGENTE
+            now = datetime.now()
+            parsed = (
+                self._parse_warning(aviso, dept_upper, now) for aviso in data["Avisos"]
+            )
+            return [w for w in parsed if w and w.status in _ACTIVE_STATUSES]
 
         except Exception as e:
             console.print(f"[red]Error scraping {department}: {e}[/red]")
@@ -158,23 +188,24 @@ class WarningScraper:
             if not departments or settings.scrape_all_departments:
                 departments = list(self.DEPARTMENT_IDS.keys())
 
-        all_warnings = []
-        seen_combinations = set()
-
-        for department in departments:
-            console.print(f"[dim]Scraping warnings for {department}...[/dim]")
+        # Deduplicate by (warning_number, department), keeping the first seen
+        collected: dict[tuple[str, str], Warning] = {}
 
-            dept_warnings = self.scrape_warnings_for_department(department)
+        # Requests are I/O bound, so fetch departments concurrently.
+        # map() keeps results in department order for deterministic dedup.
+        with ThreadPoolExecutor(max_workers=settings.scrape_max_workers) as executor:
+            results = executor.map(self.scrape_warnings_for_department, departments)
 
-            # Deduplicate by (warning_number, department) combination
-            for warning in dept_warnings:
-                combination = (warning.warning_number, warning.department)
-                if combination not in seen_combinations:
-                    all_warnings.append(warning)
-                    seen_combinations.add(combination)
+            for dept_warnings in results:
+                for warning in dept_warnings:
+                    collected.setdefault(
+                        (warning.warning_number, warning.department), warning
+                    )
 
         # Sort by issued_at (most recent first)
-        all_warnings.sort(key=lambda w: w.issued_at, reverse=True)
+        all_warnings = sorted(
+            collected.values(), key=attrgetter("issued_at"), reverse=True
+        )
 
         # NO limit - return all active warnings
         return all_warnings
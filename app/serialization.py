@@ -0,0 +1,45 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from raw bytes or text."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for NumPy arrays and scalars with the stdlib."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes, including NumPy arrays.
+
+    Args:
+        obj: Object to serialize
+        default: Encoder for types neither backend handles (default: NumPy only)
+    """
+    if default is None:
+        default = _default
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, default=default, ensure_ascii=False).encode()
@@ -1,30 +1,47 @@
 """Service for reading Peru boundaries (departments, districts)."""
 
 from pathlib import Path
+from typing import ClassVar
+
 import geopandas as gpd
 
+from app import serialization
+
 
 class BoundariesService:
     """Service for Peru administrative boundaries."""
 
     DEPARTMENTS_PATH = Path("data/boundaries/departments/DEPARTAMENTOS.shp")
-
-    def __init__(self):
-        """Initialize service and load shapefiles."""
-        self._departments_gdf = None
+    # Prebuilt FeatureCollection, written by `senamhi geo boundaries`
+    DEPARTMENTS_GEOJSON_PATH = Path("data/boundaries/departments.geojson.bin")
+
+    # Boundaries never change at runtime and routes create a service per
+    # request, so the loaded data and derived lookups are shared by class
+    _departments_gdf: ClassVar[gpd.GeoDataFrame | None] = None
+    _name_to_idx: ClassVar[dict[str, int]] = {}
+    _department_geojson: ClassVar[dict[str, dict]] = {}
+    _department_geojson_bytes: ClassVar[dict[str, bytes]] = {}
+    _all_departments_geojson: ClassVar[dict | None] = None
+    _all_departments_geojson_bytes: ClassVar[bytes | None] = None
 
     @property
     def departments_gdf(self) -> gpd.GeoDataFrame:
         """Lazy load departments geodataframe."""
-        if self._departments_gdf is None and self.DEPARTMENTS_PATH.exists():
-            self._departments_gdf = gpd.read_file(self.DEPARTMENTS_PATH)
+        cls = type(self)
+        if cls._departments_gdf is None and self.DEPARTMENTS_PATH.exists():
+            gdf = gpd.read_file(self.DEPARTMENTS_PATH, engine="pyogrio")
             # Ensure WGS84
-            if (
-                self._departments_gdf.crs
-                and self._departments_gdf.crs.to_epsg() != 4326
-            ):
-                self._departments_gdf = self._departments_gdf.to_crs(epsg=4326)
-        return self._departments_gdf
+            if gdf.crs and gdf.crs.to_epsg() != 4326:
+                gdf = gdf.to_crs(epsg=4326)
+
+            # Case-insensitive name -> row position (first match wins)
+            name_to_idx = {}
+            for idx, name in enumerate(gdf["DEPARTAMEN"]):
+                name_to_idx.setdefault(name.upper(), idx)
+
+            cls._name_to_idx = name_to_idx
+            cls._departments_gdf = gdf
+        return cls._departments_gdf
 
     def get_department_bounds(self, department_name: str) -> dict | None:
         """
@@ -40,16 +57,12 @@ class BoundariesService:
         if self.departments_gdf is None:
             return None
 
-        # Find department (case insensitive)
-        dept = self.departments_gdf[
-            self.departments_gdf["DEPARTAMEN"].str.upper() == department_name.upper()
-        ]
-
-        if dept.empty:
+        idx = self._name_to_idx.get(department_name.upper())
+        if idx is None:
             return None
 
-        # Get bounds
-        bounds = dept.total_bounds  # [minx, miny, maxx, maxy]
+        # Get bounds (minx, miny, maxx, maxy)
+        bounds = self.departments_gdf.geometry.iloc[idx].bounds
 
         return {
             "west": float(bounds[0]),
@@ -71,23 +84,79 @@ class BoundariesService:
         if self.departments_gdf is None:
             return None
 
-        # Find department (case insensitive)
-        dept = self.departments_gdf[
-            self.departments_gdf["DEPARTAMEN"].str.upper() == department_name.upper()
-        ]
+        key = department_name.upper()
+        if key not in self._department_geojson:
+            idx = self._name_to_idx.get(key)
+            if idx is None:
+                return None
+
+            # Get geometry from the GeoDataFrame row
+            row = self.departments_gdf.iloc[idx]
+            self._department_geojson[key] = {
+                "type": "Feature",
+                "properties": {"name": row["DEPARTAMEN"]},
+                "geometry": row.geometry.__geo_interface__,
+            }
+
+        return self._department_geojson[key]
+
+    def get_department_geojson_bytes(self, department_name: str) -> bytes | None:
+        """
+        Get GeoJSON for a department, already serialized.
+
+        Args:
+            department_name: Department name (e.g., "LIMA")
+
+        Returns:
+            GeoJSON Feature as UTF-8 JSON bytes or None if not found
+        """
+        key = department_name.upper()
+        if key not in self._department_geojson_bytes:
+            geojson = self.get_department_geojson(key)
+            if geojson is None:
+                return None
+            self._department_geojson_bytes[key] = serialization.dumps(geojson)
 
-        if dept.empty:
+        return self._department_geojson_bytes[key]
+
+    def _build_all_departments_geojson(self) -> dict | None:
+        """Build the department FeatureCollection from the shapefile."""
+        if self.departments_gdf is None:
             return None
 
-        # Get geometry from the GeoDataFrame row
-        geom = dept.iloc[0].geometry
-        name = dept.iloc[0]["DEPARTAMEN"]
+        names = self.departments_gdf[["DEPARTAMEN", "geometry"]].rename(
+            columns={"DEPARTAMEN": "name"}
+        )
+        return names.to_geo_dict(drop_id=True)
+
+    def _read_geojson_cache(self) -> bytes | None:
+        """Read the prebuilt GeoJSON blob if it is newer than the shapefile."""
+        try:
+            cache_mtime = self.DEPARTMENTS_GEOJSON_PATH.stat().st_mtime
+            if cache_mtime < self.DEPARTMENTS_PATH.stat().st_mtime:
+                return None
+            return self.DEPARTMENTS_GEOJSON_PATH.read_bytes()
+        except OSError:
+            return None
 
-        return {
-            "type": "Feature",
-            "properties": {"name": name},
-            "geometry": geom.__geo_interface__,
-        }
+    def get_all_departments_geojson_bytes(self) -> bytes | None:
+        """
+        Get GeoJSON for all departments, already serialized.
+
+        Returns:
+            FeatureCollection as UTF-8 JSON bytes or None if not available
+        """
+        cls = type(self)
+        if cls._all_departments_geojson_bytes is None:
+            blob = self._read_geojson_cache()
+            if blob is None:
+                geojson = self.get_all_departments_geojson()
+                if geojson is None:
+                    return None
+                blob = serialization.dumps(geojson)
+            cls._all_departments_geojson_bytes = blob
+
+        return cls._all_departments_geojson_bytes
 
     def get_all_departments_geojson(self) -> dict | None:
         """
@@ -96,17 +165,33 @@ class BoundariesService:
         Returns:
             GeoJSON FeatureCollection dict or None if not available
         """
-        if self.departments_gdf is None:
+        cls = type(self)
+        if cls._all_departments_geojson is None:
+            blob = cls._all_departments_geojson_bytes or self._read_geojson_cache()
+            if blob is not None:
+                # Prebuilt blob skips loading the shapefile altogether
+                cls._all_departments_geojson = serialization.loads(blob)
+            else:
+                # Boundaries never change at runtime, build the collection once
+                cls._all_departments_geojson = self._build_all_departments_geojson()
+
+        return cls._all_departments_geojson
+
+    def build_geojson_cache(self) -> Path | None:
+        """
+        Serialize all department boundaries to the on-disk GeoJSON blob.
+
+        Returns:
+            Path to the written file or None if the shapefile is missing
+        """
+        geojson = self._build_all_departments_geojson()
+        if geojson is None:
             return None
 
-        features = []
-        for idx, row in self.departments_gdf.iterrows():
-            features.append(
-                {
-                    "type": "Feature",
-                    "properties": {"name": row["DEPARTAMEN"]},
-                    "geometry": row.geometry.__geo_interface__,
-                }
-            )
-
-        return {"type": "FeatureCollection", "features": features}
+        blob = serialization.dumps(geojson)
+        self.DEPARTMENTS_GEOJSON_PATH.write_bytes(blob)
+
+        cls = type(self)
+        cls._all_departments_geojson = geojson
+        cls._all_departments_geojson_bytes = blob
+        return self.DEPARTMENTS_GEOJSON_PATH
@@ -5,7 +5,7 @@ import yaml
 from rich.console import Console
 
 from app.database import SessionLocal
-from app.storage.models import Location
+from app.storage.models import Location, utc_now
 
 console = Console()
 
@@ -34,8 +34,13 @@ def populate_coordinates(skip_existing: bool = True) -> dict:
     stats = {"updated": 0, "skipped": 0, "not_found": 0}
 
     try:
-        locations = db.query(Location).all()
+        # Only the columns needed for the lookup, no ORM change tracking
+        locations = db.query(
+            Location.id, Location.location, Location.department, Location.latitude
+        ).all()
 
+        updates = []
+        now = utc_now()
         for location in locations:
             # Skip if has coordinates and skip_existing=True
             if skip_existing and location.latitude is not None:
@@ -47,13 +52,22 @@ def populate_coordinates(skip_existing: bool = True) -> dict:
             coords = dept_coords.get(location.location)
 
             if coords and len(coords) == 2:
-                location.latitude = coords[0]
-                location.longitude = coords[1]
-                stats["updated"] += 1
+                updates.append(
+                    {
+                        "id": location.id,
+                        "latitude": coords[0],
+                        "longitude": coords[1],
+                        "updated_at": now,
+                    }
+                )
             else:
                 stats["not_found"] += 1
 
-        db.commit()
+        # Single executemany UPDATE instead of one statement per location
+        if updates:
+            db.bulk_update_mappings(Location, updates)
+            db.commit()
+        stats["updated"] = len(updates)
 
         if stats["updated"] > 0:
             console.print(
@@ -1,8 +1,10 @@
 # app/services/geo_service.py
 """Geospatial service with fallback support for SQLite."""
 
-from math import asin, cos, radians, sin, sqrt
+from math import cos, radians
 
+import numpy as np
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.storage.models import Location
@@ -13,6 +15,17 @@ if settings.supports_postgis:
     from geoalchemy2.functions import ST_DWithin
     from geoalchemy2.elements import WKTElement
 
+EARTH_RADIUS_KM = 6371
+# Slightly under the true ~111 km so the bounding box never clips the radius
+KM_PER_DEGREE = 110.0
+
+
+def _point_from_columns():
+    """SQL expression building a location's point from its own lat/lon columns."""
+    return func.ST_SetSRID(
+        func.ST_MakePoint(Location.longitude, Location.latitude), 4326
+    )
+
 
 class GeoService:
     """Service for geospatial operations with SQLite fallback."""
@@ -67,46 +80,52 @@ class GeoService:
     def _find_nearby_haversine(
         self, latitude: float, longitude: float, radius_km: float
     ) -> list[Location]:
-        """Find nearby locations using Haversine formula (Python fallback)."""
+        """Find nearby locations using Haversine formula (NumPy fallback)."""
+        # Coarse bounding box in SQL so only nearby candidates are loaded
+        # (longitude span uses the box edge farthest from the equator)
+        delta_lat = radius_km / KM_PER_DEGREE
+        cos_lat = cos(radians(min(90.0, abs(latitude) + delta_lat)))
+        delta_lon = radius_km / (KM_PER_DEGREE * cos_lat) if cos_lat > 1e-6 else 180.0
+
+        # Only ids and coordinates are needed to compute distances
+        rows = (
+            self.db.query(Location.id, Location.latitude, Location.longitude)
+            .filter(
+                Location.latitude.between(latitude - delta_lat, latitude + delta_lat),
+                Location.longitude.between(
+                    longitude - delta_lon, longitude + delta_lon
+                ),
+            )
+            .all()
+        )
 
-        def haversine_distance(
-            lat1: float, lon1: float, lat2: float, lon2: float
-        ) -> float:
-            """Calculate great circle distance in kilometers."""
-            R = 6371  # Earth radius in kilometers
+        if not rows:
+            return []
 
-            # Convert to radians
-            lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+        data = np.asarray(rows, dtype=np.float64)
+        ids = data[:, 0].astype(np.int64)
+        lats = np.radians(data[:, 1])
+        lons = np.radians(data[:, 2])
+        lat0, lon0 = radians(latitude), radians(longitude)
 
-            # Haversine formula
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-            a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-            c = 2 * asin(sqrt(a))
+        # Vectorized Haversine great circle distance in kilometers
+        a = (
+            np.sin((lats - lat0) / 2) ** 2
+            + cos(lat0) * np.cos(lats) * np.sin((lons - lon0) / 2) ** 2
+        )
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
 
-            return R * c
+        nearby_ids = ids[distances <= radius_km].tolist()
+        if not nearby_ids:
+            return []
 
-        # Get all locations with coordinates
-        all_locations = (
+        return (
             self.db.query(Location)
-            .filter(
-                Location.latitude.isnot(None),
-                Location.longitude.isnot(None),
-            )
+            .filter(Location.id.in_(nearby_ids))
+            .order_by(Location.id)
             .all()
         )
 
-        # Filter by distance in Python
-        nearby = []
-        for location in all_locations:
-            distance = haversine_distance(
-                latitude, longitude, location.latitude, location.longitude
-            )
-            if distance <= radius_km:
-                nearby.append(location)
-
-        return nearby
-
     def sync_point_from_coordinates(self, location_id: int) -> bool:
         """
         Sync point geometry from lat/lon for a single location.
@@ -120,18 +139,19 @@ class GeoService:
         if not settings.supports_postgis:
             return False
 
-        location = self.db.query(Location).filter(Location.id == location_id).first()
-
-        if not location or not location.latitude or not location.longitude:
-            return False
-
-        # Update point geometry
-        location.point = WKTElement(
-            f"POINT({location.longitude} {location.latitude})", srid=4326
+        # Build the point server-side in a single UPDATE
+        updated = (
+            self.db.query(Location)
+            .filter(
+                Location.id == location_id,
+                Location.latitude.isnot(None),
+                Location.longitude.isnot(None),
+            )
+            .update({"point": _point_from_columns()}, synchronize_session=False)
         )
 
         self.db.commit()
-        return True
+        return updated > 0
 
     def sync_all_points(self) -> int:
         """
@@ -143,22 +163,15 @@ class GeoService:
         if not settings.supports_postgis:
             return 0
 
-        locations = (
+        count = (
             self.db.query(Location)
             .filter(
                 Location.latitude.isnot(None),
                 Location.longitude.isnot(None),
             )
-            .all()
+            .update({"point": _point_from_columns()}, synchronize_session=False)
         )
 
-        count = 0
-        for location in locations:
-            location.point = WKTElement(
-                f"POINT({location.longitude} {location.latitude})", srid=4326
-            )
-            count += 1
-
         self.db.commit()
         return count
 
@@ -1,17 +1,22 @@
 """Service for GeoJSON conversion and operations."""
 
-import json
+import time
 
 from sqlalchemy.orm import Session
 
+from app import serialization
 from app.storage.models import WarningAlert
 from app.storage.crud import get_active_warnings
 from config.settings import settings
 
 if settings.supports_postgis:
-    from geoalchemy2.functions import ST_AsGeoJSON
     from app.storage.geo_models import WarningGeometry
 
+# Active warnings change at most every scrape; map polls can share one payload
+ACTIVE_WARNINGS_GEOJSON_TTL_SECONDS = 60
+# database url -> (expires at, serialized FeatureCollection)
+_active_warnings_geojson: dict[str, tuple[float, bytes]] = {}
+
 
 class GeoJSONService:
     """Service for GeoJSON operations."""
@@ -61,55 +66,31 @@ class GeoJSONService:
         else:
             return None
 
-        # Query by warning_number instead of warning_id
-        from app.storage.geo_crud import (
-            get_warning_geometries_by_number,
-            get_warning_geometry_by_number_and_day,
-        )
-
-        # Single day requested
-        if day_number is not None:
-            geometries = get_warning_geometry_by_number_and_day(
-                self.db, warning_number, day_number
-            )
-            if not geometries:
-                return None
-
-            features = [
-                self._create_geojson_feature(geom, warning)
-                for geom in geometries
-                if geom.geometry
-            ]
-
-            return {
-                "type": "FeatureCollection",
-                "features": features,
-            }
+        from app.storage.geo_crud import get_warning_geojson_by_numbers
 
-        # All days
-        geometries = get_warning_geometries_by_number(self.db, warning_number)
-        if not geometries:
+        # Geometries and their GeoJSON come back in a single query
+        rows = get_warning_geojson_by_numbers(
+            self.db, [warning_number], day_number=day_number
+        )
+        if not rows:
             return None
 
-        features = [
-            self._create_geojson_feature(geom, warning)
-            for geom in geometries
-            if geom.geometry
-        ]
-
         return {
             "type": "FeatureCollection",
-            "features": features,
+            "features": [
+                self._create_geojson_feature(geom, geojson_str, warning)
+                for geom, geojson_str in rows
+            ],
         }
 
     def _create_geojson_feature(
-        self, geometry_record: "WarningGeometry", warning: WarningAlert
+        self,
+        geometry_record: "WarningGeometry",
+        geojson_str: str | None,
+        warning: WarningAlert,
     ) -> dict:
-        """Create GeoJSON Feature from geometry record."""
-        # Get GeoJSON from PostGIS
-        geojson_str = self.db.query(ST_AsGeoJSON(geometry_record.geometry)).scalar()
-
-        geometry_dict = json.loads(geojson_str) if geojson_str else None
+        """Create GeoJSON Feature from geometry record and its GeoJSON string."""
+        geometry_dict = serialization.loads(geojson_str) if geojson_str else None
 
         return {
             "type": "Feature",
@@ -139,21 +120,50 @@ class GeoJSONService:
         if not settings.supports_postgis:
             return {"type": "FeatureCollection", "features": []}
 
+        from app.storage.geo_crud import get_warning_geojson_by_numbers
+
         active_warnings = get_active_warnings(self.db)
-        features = []
 
-        for warning in active_warnings:
-            geojson = self.warning_geometry_to_geojson(warning.id)
-            if geojson and geojson.get("type") == "FeatureCollection":
-                features.extend(geojson["features"])
-            elif geojson and geojson.get("type") == "Feature":
-                features.append(geojson)
+        # Fetch geometries for every active warning number in one query
+        rows_by_number: dict[str, list[tuple]] = {}
+        for geom, geojson_str in get_warning_geojson_by_numbers(
+            self.db, list({w.warning_number for w in active_warnings})
+        ):
+            rows_by_number.setdefault(geom.warning_number, []).append(
+                (geom, geojson_str)
+            )
+
+        # Warnings share geometries across departments, one feature per warning
+        features = [
+            self._create_geojson_feature(geom, geojson_str, warning)
+            for warning in active_warnings
+            for geom, geojson_str in rows_by_number.get(warning.warning_number, [])
+        ]
 
         return {
             "type": "FeatureCollection",
             "features": features,
         }
 
+    def get_active_warnings_geojson_bytes(self) -> bytes:
+        """
+        Get active warnings GeoJSON already serialized, cached for a short TTL.
+
+        Returns:
+            FeatureCollection as UTF-8 JSON bytes
+        """
+        db_url = str(self.db.get_bind().url)
+        cached = _active_warnings_geojson.get(db_url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        blob = serialization.dumps(self.get_active_warnings_geojson())
+        _active_warnings_geojson[db_url] = (
+            time.monotonic() + ACTIVE_WARNINGS_GEOJSON_TTL_SECONDS,
+            blob,
+        )
+        return blob
+
     def get_backend_capabilities(self) -> dict:
         """Get GeoJSON backend capabilities."""
         return {
@@ -1,9 +1,16 @@
 """Open Meteo API client for weather forecasts."""
 
+import copy
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from app.logging import setup_logging
 
+import numpy as np
 import openmeteo_requests
-import pandas as pd
 
 from config.settings import settings
 
@@ -17,6 +24,40 @@ except ImportError:
 
 logger = setup_logging(module_name="openmeteo")
 
+LIMA_UTC_OFFSET = np.timedelta64(-5, "h")
+
+# Parsed forecasts are reused across page views; Open Meteo updates hourly
+FORECAST_CACHE_TTL_SECONDS = 900
+FORECAST_CACHE_MAX_ENTRIES = 512
+
+# Substring of the Open Meteo variable id -> simplified result key
+_VARIABLE_KEYS = (
+    ("temperature", "temperature"),
+    ("precipitation", "precipitation"),
+    ("wind", "wind_speed"),
+)
+
+
+def _simplify_variable(var_id: str) -> str | None:
+    """Map an Open Meteo variable id to its simplified key name."""
+    for fragment, key in _VARIABLE_KEYS:
+        if fragment in var_id:
+            return key
+    return None
+
+
+@lru_cache(maxsize=32)
+def _local_timestamps(start: int, end: int, interval: int) -> tuple[str, ...]:
+    """ISO timestamps in Lima time for an hourly axis, shared across models."""
+    # Hourly timestamps in Lima local time (UTC-5, no DST since 1994)
+    timestamps_utc = np.arange(start, end, interval, dtype=np.int64).astype(
+        "datetime64[s]"
+    )
+    timestamps_local = timestamps_utc + LIMA_UTC_OFFSET
+
+    # Format as ISO strings without timezone info (already in local time)
+    return tuple(np.datetime_as_string(timestamps_local, unit="s").tolist())
+
 
 class OpenMeteoClient:
     """Client for Open Meteo API."""
@@ -27,10 +68,14 @@ class OpenMeteoClient:
 
         # Extract model IDs from config
         self.models = [m["id"] for m in self.config["models"]]
+        self._models_param = ",".join(self.models)
 
         # Extract variable IDs from config
         self.variables = [v["id"] for v in self.config["variables"]]
 
+        # Simplified result key for each variable, by position in the response
+        self._var_keys = [_simplify_variable(var_id) for var_id in self.variables]
+
         # Setup cache if available
         if CACHE_AVAILABLE:
             cache_session = requests_cache.CachedSession(".cache", expire_after=3600)
@@ -42,19 +87,23 @@ class OpenMeteoClient:
 
         self.url = settings.get_openmeteo_url()
 
+        # (lat, lon, models, days) -> (expires at, forecast), shared by threads
+        self._forecast_cache: dict[tuple, tuple[float, dict]] = {}
+        self._cache_lock = threading.Lock()
+
     def get_config(self) -> dict:
         """Get Open Meteo configuration."""
         return self.config
 
-    def get_hourly_forecast(
+    def iter_hourly_forecast(
         self,
         latitude: float,
         longitude: float,
         models: list[str] | None = None,
         forecast_days: int | None = None,
-    ) -> dict:
+    ) -> Iterator[dict]:
         """
-        Get hourly forecast for location.
+        Yield hourly forecast for location one model at a time.
 
         Args:
             latitude: Location latitude
@@ -62,11 +111,14 @@ class OpenMeteoClient:
             models: List of models to use (default: from config)
             forecast_days: Number of days to forecast (default: from config)
 
-        Returns:
-            Dict with forecast data by model
+        Yields:
+            Dicts with "model" id and its parsed "data"
         """
         if models is None:
             models = self.models
+            models_param = self._models_param
+        else:
+            models_param = ",".join(models)
 
         if forecast_days is None:
             forecast_days = self.config["forecast_days"]
@@ -75,21 +127,63 @@ class OpenMeteoClient:
             "latitude": latitude,
             "longitude": longitude,
             "hourly": self.variables,
-            "models": ",".join(models),
+            "models": models_param,
             "forecast_days": forecast_days,
         }
 
-        try:
-            responses = self.client.weather_api(self.url, params=params)
+        responses = self.client.weather_api(self.url, params=params)
 
+        # Parse lazily so consumers can forward each model as soon as it is ready
+        for model, response in zip(models, responses):
+            yield {"model": model, "data": self._parse_hourly_response(response)}
+
+    def get_hourly_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        models: list[str] | None = None,
+        forecast_days: int | None = None,
+    ) -> dict:
+        """
+        Get hourly forecast for location.
+
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            models: List of models to use (default: from config)
+            forecast_days: Number of days to forecast (default: from config)
+
+        Returns:
+            Dict with forecast data by model
+        """
+        # ~100 m grid, well below the model resolution
+        key = (
+            round(latitude, 3),
+            round(longitude, 3),
+            tuple(models) if models is not None else None,
+            forecast_days,
+        )
+        with self._cache_lock:
+            cached = self._forecast_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            # Callers get their own copy so changes never reach the cache
+            return copy.deepcopy(cached[1])
+
+        try:
             result = {"latitude": latitude, "longitude": longitude, "models": {}}
 
             # Process each model response
-            for i, model in enumerate(models):
-                if i < len(responses):
-                    response = responses[i]
-                    model_data = self._parse_hourly_response(response)
-                    result["models"][model] = model_data
+            for item in self.iter_hourly_forecast(
+                latitude, longitude, models=models, forecast_days=forecast_days
+            ):
+                result["models"][item["model"]] = item["data"]
+
+            # Parse failures come back as empty series; don't keep those
+            # around for the whole TTL
+            expected = len(models) if models is not None else len(self.models)
+            parsed = [data for data in result["models"].values() if data["timestamps"]]
+            if len(parsed) == expected:
+                self._cache_forecast(key, copy.deepcopy(result))
 
             return result
 
@@ -97,6 +191,44 @@ class OpenMeteoClient:
             logger.error(f"Error fetching Open Meteo data: {e}")
             return {"error": str(e), "models": {}}
 
+    def get_hourly_forecast_batch(
+        self, coordinates: list[tuple[float, float]]
+    ) -> list[dict]:
+        """
+        Get hourly forecasts for several locations concurrently.
+
+        Args:
+            coordinates: List of (latitude, longitude) pairs
+
+        Returns:
+            Forecast dicts in the same order as coordinates
+        """
+        if not coordinates:
+            return []
+
+        max_workers = min(settings.scrape_max_workers, len(coordinates))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda coords: self.get_hourly_forecast(*coords), coordinates
+                )
+            )
+
+    def _cache_forecast(self, key: tuple, forecast: dict) -> None:
+        """Store a forecast, dropping expired or oldest entries when full."""
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._forecast_cache) >= FORECAST_CACHE_MAX_ENTRIES:
+                for stale in [
+                    k
+                    for k, (expires, _) in self._forecast_cache.items()
+                    if expires <= now
+                ]:
+                    del self._forecast_cache[stale]
+            if len(self._forecast_cache) >= FORECAST_CACHE_MAX_ENTRIES:
+                del self._forecast_cache[next(iter(self._forecast_cache))]
+            self._forecast_cache[key] = (now + FORECAST_CACHE_TTL_SECONDS, forecast)
+
     def _parse_hourly_response(self, response) -> dict:
         """Parse hourly response from Open Meteo API."""
         try:
@@ -105,34 +237,16 @@ class OpenMeteoClient:
             # Get variables dynamically based on config
             result = {}
 
-            for i, var_config in enumerate(self.config["variables"]):
-                var_id = var_config["id"]
-                values = hourly.Variables(i).ValuesAsNumpy()
-
-                # Use simplified key names
-                if "temperature" in var_id:
-                    result["temperature"] = values.tolist()
-                elif "precipitation" in var_id:
-                    result["precipitation"] = values.tolist()
-                elif "wind" in var_id:
-                    result["wind_speed"] = values.tolist()
-
-            # Create timestamps in UTC
-            timestamps_utc = pd.date_range(
-                start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-                end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-                freq=pd.Timedelta(seconds=hourly.Interval()),
-                inclusive="left",
-            )
-
-            # Convert to Lima timezone (UTC-5)
-            lima_tz = "America/Lima"
-            timestamps_local = timestamps_utc.tz_convert(lima_tz)
+            # Keep each series as its NumPy array; it is serialized straight
+            # from the buffer at the JSON boundary (see app.serialization)
+            for i, key in enumerate(self._var_keys):
+                if key is not None:
+                    result[key] = hourly.Variables(i).ValuesAsNumpy()
 
-            # Format as ISO strings without timezone info (already in local time)
-            result["timestamps"] = [
-                ts.strftime("%Y-%m-%dT%H:%M:%S") for ts in timestamps_local
-            ]
+            # Models in one request share the time axis, so it is built once
+            result["timestamps"] = list(
+                _local_timestamps(hourly.Time(), hourly.TimeEnd(), hourly.Interval())
+            )
 
             return result
 
@@ -144,3 +258,14 @@ class OpenMeteoClient:
                 "precipitation": [],
                 "wind_speed": [],
             }
+
+
+@lru_cache(maxsize=1)
+def get_openmeteo_client() -> OpenMeteoClient:
+    """
+    Return the process-wide Open Meteo client.
+
+    Reusing one client keeps its HTTP cache and connection pool alive
+    across web requests instead of rebuilding them per page view.
+    """
+    return OpenMeteoClient()
@@ -1,10 +1,14 @@
 """Weather service layer - centralizes business logic."""
 
+import time
+from collections.abc import Iterable
 from typing import Protocol
 from datetime import datetime
 from rich.console import Console
+from sqlalchemy import Row, func
 from sqlalchemy.orm import Session
 
+from app.database import scrape_transaction
 from app.scrapers.forecast_scraper import ForecastScraper
 from app.scrapers.warning_scraper import WarningScraper
 from app.storage import crud
@@ -13,6 +17,38 @@ from config.settings import settings
 
 console = Console()
 
+# (database url, issued_at, department) -> when forecasts were seen to exist.
+# Scheduler retries re-check the same issue date; saved issues are never
+# removed by the app except on a forced replace, which re-saves them.
+EXISTING_ISSUE_TTL_SECONDS = 300
+_existing_issues: dict[tuple[str, datetime, str], float] = {}
+
+
+def _issue_seen(db_url: str, issued_at: datetime, department: str) -> bool:
+    """Whether forecasts for this issue were seen within the TTL."""
+    seen_at = _existing_issues.get((db_url, issued_at, department.upper()))
+    return (
+        seen_at is not None and time.monotonic() - seen_at < EXISTING_ISSUE_TTL_SECONDS
+    )
+
+
+def _mark_issue_seen(
+    db_url: str, issued_at: datetime, departments: Iterable[str]
+) -> None:
+    """Remember that forecasts exist for this issue in these departments."""
+    now = time.monotonic()
+
+    # Drop expired entries so a long-running scheduler doesn't accumulate them
+    for key in [
+        key
+        for key, seen_at in _existing_issues.items()
+        if now - seen_at >= EXISTING_ISSUE_TTL_SECONDS
+    ]:
+        del _existing_issues[key]
+
+    for department in departments:
+        _existing_issues[(db_url, issued_at, department.upper())] = now
+
 
 class DatabaseSession(Protocol):
     """Protocol for database session."""
@@ -28,6 +64,8 @@ class WeatherService:
         self.db = db
         self.forecast_scraper = ForecastScraper()
         self.warning_scraper = WarningScraper()
+        # Location name -> Location, filled as names are looked up
+        self._location_cache: dict[str, Location] = {}
 
     def update_forecasts(
         self,
@@ -68,11 +106,21 @@ class WeatherService:
 
         issued_at = forecasts[0].issued_at
 
-        # Check if data exists
-        data_exists = any(
-            crud.forecast_exists_for_issue_date(self.db, issued_at, dept)
-            for dept in dept_list
-        )
+        # Check if data exists: recently seen issues first, then one query
+        # (stored departments are uppercase, requested ones may not be)
+        db_url = str(self.db.get_bind().url)
+        check_depts = [dept.upper() for dept in dept_list]
+        existing_depts = {
+            dept for dept in check_depts if _issue_seen(db_url, issued_at, dept)
+        }
+        unknown_depts = [dept for dept in check_depts if dept not in existing_depts]
+        if unknown_depts and (force or not existing_depts):
+            found = crud.departments_with_forecasts_for_issue_date(
+                self.db, issued_at, unknown_depts
+            )
+            _mark_issue_seen(db_url, issued_at, found)
+            existing_depts |= found
+        data_exists = bool(existing_depts)
 
         if data_exists and not force:
             return {
@@ -84,16 +132,34 @@ class WeatherService:
                 "message": "Data already exists for this issue date",
             }
 
-        # Delete existing data if force
-        if data_exists and force:
-            for dept in dept_list:
-                crud.delete_forecasts_by_issue_date(self.db, issued_at, dept)
-
-        # Save forecasts
+        # Replace and save the whole issue in one transaction
         saved_count = 0
-        for location_forecast in forecasts:
-            saved = crud.save_forecast(self.db, location_forecast)
-            saved_count += len(saved)
+        with scrape_transaction(self.db):
+            if data_exists and force:
+                crud.delete_forecasts_by_issue_date(
+                    self.db, issued_at, sorted(existing_depts), commit=False
+                )
+
+            # Resolve all locations up front instead of once per forecast
+            location_ids = crud.bulk_get_or_create_locations(
+                self.db,
+                [(f.location, f.department, f.full_name) for f in forecasts],
+                commit=False,
+            )
+
+            for location_forecast in forecasts:
+                saved = crud.save_forecast(
+                    self.db,
+                    location_forecast,
+                    location_ids[location_forecast.location],
+                    commit=False,
+                )
+                saved_count += len(saved)
+
+        # Locations may have been created or changed
+        self._location_cache.clear()
+
+        _mark_issue_seen(db_url, issued_at, {f.department for f in forecasts})
 
         return {
             "success": True,
@@ -126,23 +192,22 @@ class WeatherService:
                 "updated": 0,
             }
 
-        saved_count = 0
-        updated_count = 0
-
-        for warning in warnings:
-            existing = crud.get_warning_by_number(
-                self.db, warning.warning_number, warning.department
-            )
-
-            if existing and not force:
-                continue
+        # One lookup for what is already stored, then one upsert
+        existing_keys = crud.get_existing_warning_keys(self.db, warnings)
 
-            crud.save_warning(self.db, warning)
+        to_save = [
+            warning
+            for warning in warnings
+            if force
+            or (warning.warning_number, warning.department) not in existing_keys
+        ]
+        crud.save_warnings(self.db, to_save)
 
-            if existing:
-                updated_count += 1
-            else:
-                saved_count += 1
+        updated_count = sum(
+            (warning.warning_number, warning.department) in existing_keys
+            for warning in to_save
+        )
+        saved_count = len(to_save) - updated_count
 
         return {
             "success": True,
@@ -201,7 +266,7 @@ class WeatherService:
         Returns:
             Dict with location and forecasts, or None if not found
         """
-        location = crud.get_location_by_name(self.db, location_name.upper())
+        location = self._get_location(location_name)
 
         if not location:
             return None
@@ -217,18 +282,33 @@ class WeatherService:
         """Get list of departments available from SENAMHI."""
         return self.forecast_scraper.get_all_departments()
 
-    def _get_department_locations(self, department: str) -> list[Location]:
-        """Get all locations for a department."""
-        all_locations = crud.get_locations(self.db, active_only=True)
-        return [
-            loc for loc in all_locations if loc.department.upper() == department.upper()
-        ]
+    def _get_location(self, location_name: str) -> Location | None:
+        """Look up a location by name, memoizing hits for this service."""
+        name = location_name.upper()
+        location = self._location_cache.get(name)
+        if location is None:
+            location = crud.get_location_by_name(self.db, name)
+            if location is not None:
+                self._location_cache[name] = location
+        return location
+
+    def _get_department_locations(self, department: str) -> list[Row]:
+        """Get all locations for a department as read-only rows."""
+        return crud.get_location_rows(self.db, department=department, active_only=True)
 
     # Delegated CRUD operations for convenience
     def get_all_locations(self, active_only: bool = True) -> list[Location]:
         """Get all locations."""
         return crud.get_locations(self.db, active_only=active_only)
 
+    def get_locations_by_department(
+        self, department: str, active_only: bool = True
+    ) -> list[Location]:
+        """Get locations for a department."""
+        return crud.get_locations_by_department(
+            self.db, department, active_only=active_only
+        )
+
     def get_warnings(
         self,
         severity: str | None = None,
@@ -250,7 +330,7 @@ class WeatherService:
         self, location_name: str, forecast_date
     ) -> list[Forecast] | None:
         """Get forecast history for a specific date."""
-        location = crud.get_location_by_name(self.db, location_name.upper())
+        location = self._get_location(location_name)
 
         if not location:
             return None
@@ -259,16 +339,13 @@ class WeatherService:
 
     def get_database_status(self) -> dict:
         """Get overall database statistics."""
-        locations = crud.get_locations(self.db)
-        total_forecasts = self.db.query(Forecast).count()
+        # Aggregate in SQL rather than loading every Location
+        departments = crud.count_locations_by_department(self.db)
+        total_forecasts = self.db.query(func.count(Forecast.id)).scalar()
         latest_issued = crud.get_latest_issued_date(self.db)
 
-        departments = {}
-        for loc in locations:
-            departments[loc.department] = departments.get(loc.department, 0) + 1
-
         return {
-            "locations": len(locations),
+            "locations": sum(departments.values()),
             "total_forecasts": total_forecasts,
             "latest_issued": latest_issued,
             "departments": departments,
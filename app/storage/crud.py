@@ -2,76 +2,197 @@
 
 from datetime import UTC, date, datetime
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, and_, case, func, insert, select
+from sqlalchemy.orm import Session, load_only
 
 from app.models.forecast import LocationForecast as PydanticLocationForecast
 from app.storage.models import Forecast, Location
 from app.storage.models import ScrapeRun
 from app.storage.models import WarningAlert
 from app.models.warning import Warning
+from config.settings import settings
+
+
+def _dialect_insert(model):
+    """INSERT construct supporting ON CONFLICT for the configured database."""
+    if settings.is_postgresql:
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+    return dialect_insert(model)
 
 
 def get_or_create_location(
-    db: Session, location: str, department: str, full_name: str
+    db: Session,
+    location: str,
+    department: str,
+    full_name: str,
+    commit: bool = True,
 ) -> Location:
-    """Get existing location or create new one."""
-    db_location = db.query(Location).filter(Location.location == location).first()
-
-    if not db_location:
-        db_location = Location(
-            location=location,
-            department=department,
-            full_name=full_name,
-        )
-        db.add(db_location)
+    """Get existing location or create new one (commit=False only flushes)."""
+    # Steady state: the location exists, one SELECT and nothing to commit
+    db_location = get_location_by_name(db, location)
+    if db_location is not None:
+        return db_location
+
+    # Another transaction may insert it first; RETURNING is then empty
+    stmt = (
+        _dialect_insert(Location)
+        .values(location=location, department=department, full_name=full_name)
+        .on_conflict_do_nothing(index_elements=["location"])
+        .returning(Location)
+    )
+
+    db_location = db.scalars(stmt).one_or_none()
+    if db_location is None:
+        db_location = get_location_by_name(db, location)
+    if commit:
         db.commit()
-        db.refresh(db_location)
+    else:
+        db.flush()
 
     return db_location
 
 
-def save_forecast(
-    db: Session, location_forecast: PydanticLocationForecast
-) -> list[Forecast]:
-    """Save location forecast to database."""
-    db_location = get_or_create_location(
-        db,
-        location_forecast.location,
-        location_forecast.department,
-        location_forecast.full_name,
-    )
+def bulk_get_or_create_locations(
+    db: Session, locations: list[tuple[str, str, str]], commit: bool = True
+) -> dict[str, int]:
+    """
+    Get or create many locations at once.
 
-    saved_forecasts = []
+    Args:
+        locations: (location, department, full_name) tuples
+        commit: Commit new locations (False leaves it to the caller)
 
-    for daily in location_forecast.forecasts:
-        db_forecast = Forecast(
-            location_id=db_location.id,
-            forecast_date=daily.date.date()
-            if isinstance(daily.date, datetime)
-            else daily.date,
-            day_name=daily.day_name,
-            temp_max=daily.temp_max,
-            temp_min=daily.temp_min,
-            icon_number=daily.icon_number,
-            description=daily.description,
-            issued_at=location_forecast.issued_at,
-            scraped_at=location_forecast.scraped_at,
+    Returns:
+        Mapping of location name to location ID
+    """
+    if not locations:
+        return {}
+
+    names = {location for location, _, _ in locations}
+    location_ids = dict(
+        db.query(Location.location, Location.id)
+        .filter(Location.location.in_(names))
+        .all()
+    )
+
+    # Insert only the missing ones, first occurrence wins for duplicates
+    missing = {}
+    for location, department, full_name in locations:
+        if location not in location_ids and location not in missing:
+            missing[location] = {
+                "location": location,
+                "department": department,
+                "full_name": full_name,
+            }
+
+    if missing:
+        # Concurrent scrapes may add the same location; skip those rows
+        created = db.execute(
+            _dialect_insert(Location)
+            .on_conflict_do_nothing(index_elements=["location"])
+            .returning(Location.location, Location.id),
+            list(missing.values()),
         )
-        db.add(db_forecast)
-        saved_forecasts.append(db_forecast)
+        location_ids.update((name, loc_id) for name, loc_id in created)
+
+        # Rows another transaction inserted first are not returned, read them
+        raced = [name for name in missing if name not in location_ids]
+        if raced:
+            location_ids.update(
+                db.query(Location.location, Location.id)
+                .filter(Location.location.in_(raced))
+                .all()
+            )
+
+        if commit:
+            db.commit()
+
+    return location_ids
 
-    db.commit()
 
-    for forecast in saved_forecasts:
-        db.refresh(forecast)
+def save_forecast(
+    db: Session,
+    location_forecast: PydanticLocationForecast,
+    location_id: int | None = None,
+    commit: bool = True,
+) -> list[Forecast]:
+    """Save location forecast to database (commit=False leaves it to the caller)."""
+    if location_id is None:
+        # Plain (name, id) rows, so the id is not reloaded after a commit
+        location_id = bulk_get_or_create_locations(
+            db,
+            [
+                (
+                    location_forecast.location,
+                    location_forecast.department,
+                    location_forecast.full_name,
+                )
+            ],
+            commit=commit,
+        )[location_forecast.location]
+
+    rows = [
+        {
+            "location_id": location_id,
+            "forecast_date": daily.date.date()
+            if isinstance(daily.date, datetime)
+            else daily.date,
+            "day_name": daily.day_name,
+            "temp_max": daily.temp_max,
+            "temp_min": daily.temp_min,
+            "icon_number": daily.icon_number,
+            "description": daily.description,
+            "issued_at": location_forecast.issued_at,
+            "scraped_at": location_forecast.scraped_at,
+        }
+        for daily in location_forecast.forecasts
+    ]
+
+    if not rows:
+        return []
+
+    # Single executemany INSERT ... RETURNING, no per-row refresh SELECTs
+    saved_forecasts = db.scalars(
+        insert(Forecast).returning(Forecast, sort_by_parameter_order=True), rows
+    ).all()
+
+    if commit:
+        db.commit()
 
-    return saved_forecasts
+    return list(saved_forecasts)
 
 
 def get_locations(db: Session, active_only: bool = True) -> list[Location]:
     """Get all locations."""
-    query = db.query(Location)
+    # Callers list names and coordinates; skip the PostGIS point and timestamps
+    query = db.query(Location).options(
+        load_only(
+            Location.id,
+            Location.location,
+            Location.department,
+            Location.full_name,
+            Location.active,
+            Location.latitude,
+            Location.longitude,
+        )
+    )
+
+    if active_only:
+        query = query.filter(Location.active)
+
+    return query.all()
+
+
+def get_locations_by_department(
+    db: Session, department: str, active_only: bool = True
+) -> list[Location]:
+    """Get locations for a department (case-insensitive)."""
+    query = db.query(Location).filter(
+        func.upper(Location.department) == department.upper()
+    )
 
     if active_only:
         query = query.filter(Location.active)
@@ -79,23 +200,89 @@ def get_locations(db: Session, active_only: bool = True) -> list[Location]:
     return query.all()
 
 
+def get_location_rows(
+    db: Session, department: str | None = None, active_only: bool = True
+) -> list[Row]:
+    """
+    Get read-only location rows without ORM instances.
+
+    Rows expose id, location, department, full_name, active, latitude and
+    longitude as attributes, like Location.
+    """
+    query = select(
+        Location.id,
+        Location.location,
+        Location.department,
+        Location.full_name,
+        Location.active,
+        Location.latitude,
+        Location.longitude,
+    )
+
+    if department:
+        query = query.where(func.upper(Location.department) == department.upper())
+
+    if active_only:
+        query = query.where(Location.active)
+
+    return list(db.execute(query).all())
+
+
+def count_locations_by_department(
+    db: Session, active_only: bool = True
+) -> dict[str, int]:
+    """Count locations per department."""
+    query = db.query(Location.department, func.count(Location.id))
+
+    if active_only:
+        query = query.filter(Location.active)
+
+    return dict(query.group_by(Location.department).all())
+
+
 def get_location_by_name(db: Session, location: str) -> Location | None:
     """Get location by name."""
     return db.query(Location).filter(Location.location == location).first()
 
 
-def get_latest_forecasts(db: Session, location_id: int | None = None) -> list[Forecast]:
-    """Get latest forecasts for a location or all locations."""
-    subquery = (
-        db.query(
+def get_latest_forecasts(
+    db: Session,
+    location_id: int | None = None,
+    location_ids: list[int] | None = None,
+) -> list[Forecast]:
+    """Get latest forecasts for a location, a set of locations or all locations."""
+    if settings.is_postgresql:
+        # DISTINCT ON keeps the newest row per (location, date) straight off
+        # the idx_forecast_latest index, no aggregate + self-join needed
+        query = db.query(Forecast).distinct(
+            Forecast.location_id, Forecast.forecast_date
+        )
+
+        if location_id:
+            query = query.filter(Forecast.location_id == location_id)
+        if location_ids is not None:
+            query = query.filter(Forecast.location_id.in_(location_ids))
+
+        return query.order_by(
             Forecast.location_id,
             Forecast.forecast_date,
-            func.max(Forecast.scraped_at).label("max_scraped"),
-        )
-        .group_by(Forecast.location_id, Forecast.forecast_date)
-        .subquery()
+            Forecast.scraped_at.desc(),
+        ).all()
+
+    latest = db.query(
+        Forecast.location_id,
+        Forecast.forecast_date,
+        func.max(Forecast.scraped_at).label("max_scraped"),
     )
 
+    # Filter before aggregating so only these locations' rows are grouped
+    if location_id:
+        latest = latest.filter(Forecast.location_id == location_id)
+    if location_ids is not None:
+        latest = latest.filter(Forecast.location_id.in_(location_ids))
+
+    subquery = latest.group_by(Forecast.location_id, Forecast.forecast_date).subquery()
+
     query = db.query(Forecast).join(
         subquery,
         and_(
@@ -105,9 +292,6 @@ def get_latest_forecasts(db: Session, location_id: int | None = None) -> list[Fo
         ),
     )
 
-    if location_id:
-        query = query.filter(Forecast.location_id == location_id)
-
     return query.order_by(Forecast.location_id, Forecast.forecast_date).all()
 
 
@@ -145,47 +329,53 @@ def forecast_exists_for_issue_date(
     db: Session, issued_at: datetime, department: str | None = None
 ) -> bool:
     """Check if forecasts already exist for a specific issue date."""
-    query = db.query(Forecast).filter(Forecast.issued_at == issued_at)
+    query = db.query(Forecast.id).filter(Forecast.issued_at == issued_at)
 
     if department:
         query = query.join(Location).filter(Location.department == department)
 
-    return query.first() is not None
+    # EXISTS lets the database stop at the first matching index entry
+    return db.query(query.exists()).scalar()
+
+
+def departments_with_forecasts_for_issue_date(
+    db: Session, issued_at: datetime, departments: list[str]
+) -> set[str]:
+    """Get which of the given departments already have forecasts for an issue date."""
+    rows = (
+        db.query(Location.department)
+        .join(Forecast)
+        .filter(Forecast.issued_at == issued_at, Location.department.in_(departments))
+        .distinct()
+        .all()
+    )
+    return {department for (department,) in rows}
 
 
 def delete_forecasts_by_issue_date(
-    db: Session, issued_at: datetime, department: str | None = None
+    db: Session,
+    issued_at: datetime,
+    departments: str | list[str] | None = None,
+    commit: bool = True,
 ) -> int:
-    """Delete all forecasts for a specific issue date."""
-    if department:
-        # Get location IDs for this department first
-        location_ids = (
-            db.query(Location.id)
-            .filter(Location.department == department.upper())
-            .all()
-        )
-        location_ids = [loc_id[0] for loc_id in location_ids]
+    """Delete all forecasts for a specific issue date, optionally by department."""
+    # A single department name is still accepted
+    if isinstance(departments, str):
+        departments = [departments]
 
-        if not location_ids:
-            return 0
+    query = db.query(Forecast).filter(Forecast.issued_at == issued_at)
 
-        # Delete forecasts for these locations
-        count = (
-            db.query(Forecast)
-            .filter(
-                Forecast.issued_at == issued_at, Forecast.location_id.in_(location_ids)
-            )
-            .delete(synchronize_session=False)
-        )
-    else:
-        # Delete all forecasts for this issue date
-        count = (
-            db.query(Forecast)
-            .filter(Forecast.issued_at == issued_at)
-            .delete(synchronize_session=False)
+    if departments:
+        # Single DELETE with the department lookup as a subquery
+        department_location_ids = select(Location.id).where(
+            Location.department.in_([dept.upper() for dept in departments])
         )
+        query = query.filter(Forecast.location_id.in_(department_location_ids))
 
-    db.commit()
+    count = query.delete(synchronize_session=False)
+
+    if commit:
+        db.commit()
     return count
 
 
@@ -199,7 +389,6 @@ def create_scrape_run(db: Session, departments: list[str]) -> ScrapeRun:
     )
     db.add(run)
     db.commit()
-    db.refresh(run)
     return run
 
 
@@ -213,7 +402,7 @@ def update_scrape_run(
 ) -> ScrapeRun:
     """Update scrape run with results."""
 
-    run = db.query(ScrapeRun).filter(ScrapeRun.id == run_id).first()
+    run = db.get(ScrapeRun, run_id)
     if not run:
         raise ValueError(f"ScrapeRun {run_id} not found")
 
@@ -224,7 +413,6 @@ def update_scrape_run(
     run.error_message = error_message
 
     db.commit()
-    db.refresh(run)
     return run
 
 
@@ -244,54 +432,90 @@ def get_scrape_runs(
 # ==================== Warning Operations ====================
 
 
-def save_warning(db: Session, warning: Warning) -> WarningAlert:
-    """Save warning to database."""
-    # Check if warning already exists for this department
-    existing = (
-        db.query(WarningAlert)
-        .filter(
-            WarningAlert.warning_number == warning.warning_number,
-            WarningAlert.department == warning.department,
-        )
-        .first()
+def _warning_values(warning: Warning) -> dict:
+    """Column values for a scraped warning."""
+    return {
+        "senamhi_id": warning.senamhi_id,
+        "warning_number": warning.warning_number,
+        "department": warning.department,
+        "severity": warning.severity.value,
+        "status": warning.status.value,
+        "title": warning.title,
+        "description": warning.description,
+        "valid_from": warning.valid_from,
+        "valid_until": warning.valid_until,
+        "issued_at": warning.issued_at,
+        "scraped_at": warning.scraped_at,
+    }
+
+
+# Columns refreshed when a warning is scraped again
+_WARNING_UPDATE_COLUMNS = (
+    "senamhi_id",
+    "severity",
+    "status",
+    "title",
+    "description",
+    "valid_from",
+    "valid_until",
+    "issued_at",
+    "scraped_at",
+)
+
+
+def _warning_upsert(values: dict | list[dict]):
+    """INSERT ... ON CONFLICT (warning_number, department) DO UPDATE statement."""
+    stmt = _dialect_insert(WarningAlert).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=["warning_number", "department"],
+        set_={column: stmt.excluded[column] for column in _WARNING_UPDATE_COLUMNS},
     )
 
-    if existing:
-        existing.senamhi_id = warning.senamhi_id
-        existing.severity = warning.severity.value
-        existing.status = warning.status.value
-        existing.title = warning.title
-        existing.description = warning.description
-        existing.valid_from = warning.valid_from
-        existing.valid_until = warning.valid_until
-        existing.issued_at = warning.issued_at
-        existing.scraped_at = warning.scraped_at
 
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    db_warning = WarningAlert(
-        senamhi_id=warning.senamhi_id,
-        warning_number=warning.warning_number,
-        department=warning.department,
-        severity=warning.severity.value,
-        status=warning.status.value,
-        title=warning.title,
-        description=warning.description,
-        valid_from=warning.valid_from,
-        valid_until=warning.valid_until,
-        issued_at=warning.issued_at,
-        scraped_at=warning.scraped_at,
-    )
+def save_warning(db: Session, warning: Warning) -> WarningAlert:
+    """Save warning to database, updating it if it already exists."""
+    # Single upsert keyed on (warning_number, department)
+    stmt = _warning_upsert(_warning_values(warning)).returning(WarningAlert)
 
-    db.add(db_warning)
+    db_warning = db.scalars(stmt, execution_options={"populate_existing": True}).one()
     db.commit()
-    db.refresh(db_warning)
 
     return db_warning
 
 
+def save_warnings(db: Session, warnings: list[Warning]) -> int:
+    """Upsert many warnings in one statement and commit once."""
+    # A key may appear only once per statement, the last one wins
+    rows = {
+        (warning.warning_number, warning.department): _warning_values(warning)
+        for warning in warnings
+    }
+
+    if not rows:
+        return 0
+
+    db.execute(_warning_upsert(list(rows.values())))
+    db.commit()
+    return len(rows)
+
+
+def get_existing_warning_keys(
+    db: Session, warnings: list[Warning]
+) -> set[tuple[str, str]]:
+    """Get (warning_number, department) pairs already stored for these warnings."""
+    numbers = {warning.warning_number for warning in warnings}
+
+    if not numbers:
+        return set()
+
+    rows = (
+        db.query(WarningAlert.warning_number, WarningAlert.department)
+        .filter(WarningAlert.warning_number.in_(numbers))
+        .all()
+    )
+    return {(number, department) for number, department in rows}
+
+
 def get_active_warnings(
     db: Session, department: str | None = None
 ) -> list["WarningAlert"]:
@@ -307,16 +531,16 @@ def get_active_warnings(
     if department:
         query = query.filter(WarningAlert.department == department.upper())
 
-    warnings = query.all()
-
-    def sort_key(w):
-        # VIGENTE = 0, EMITIDO = 1 (VIGENTE first)
-        status_priority = 0 if w.status == "vigente" else 1
-        # Time difference from now (absolute value, closest = smallest)
-        time_diff = abs((w.valid_from - now).total_seconds())
-        return (status_priority, time_diff)
+    # VIGENTE first, then closest start to now; sorted by the database
+    status_priority = case((WarningAlert.status == "vigente", 0), else_=1)
+    if settings.is_postgresql:
+        time_diff = func.abs(func.extract("epoch", WarningAlert.valid_from - now))
+    else:
+        time_diff = func.abs(
+            func.julianday(WarningAlert.valid_from) - func.julianday(now)
+        )
 
-    return sorted(warnings, key=sort_key)
+    return query.order_by(status_priority, time_diff, WarningAlert.id).all()
 
 
 def get_warnings(
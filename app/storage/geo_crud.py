@@ -8,8 +8,10 @@ from sqlalchemy.orm import Session
 from config.settings import settings
 
 if settings.supports_postgis:
-    from geoalchemy2.elements import WKTElement
+    from geoalchemy2.shape import from_shape
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
     from shapely.geometry import MultiPolygon
+    from geoalchemy2.functions import ST_AsGeoJSON
     from app.storage.geo_models import WarningGeometry
 
 
@@ -27,8 +29,8 @@ def save_warning_geometry(
     if not settings.supports_postgis:
         return None
 
-    # Convert Shapely geometry to WKT
-    wkt_geom = WKTElement(geometry.wkt, srid=4326)
+    # Send binary EWKB instead of building and re-parsing a WKT string
+    ewkb_geom = from_shape(geometry, srid=4326, extended=True)
 
     # Check by warning_number + day_number + nivel
     existing = (
@@ -41,13 +43,15 @@ def save_warning_geometry(
         .first()
     )
 
+    now = datetime.now()
+
     if existing:
         # Update existing
-        existing.geometry = wkt_geom
+        existing.geometry = ewkb_geom
         existing.shapefile_url = shapefile_url
         existing.shapefile_path = str(shapefile_path) if shapefile_path else None
-        existing.downloaded_at = datetime.now()
-        existing.updated_at = datetime.now()
+        existing.downloaded_at = now
+        existing.updated_at = now
         db.commit()
         db.refresh(existing)
         return existing
@@ -58,10 +62,10 @@ def save_warning_geometry(
         warning_number=warning_number,
         day_number=day_number,
         nivel=nivel,
-        geometry=wkt_geom,
+        geometry=ewkb_geom,
         shapefile_url=shapefile_url,
         shapefile_path=str(shapefile_path) if shapefile_path else None,
-        downloaded_at=datetime.now(),
+        downloaded_at=now,
     )
 
     db.add(geom_record)
@@ -71,6 +75,57 @@ def save_warning_geometry(
     return geom_record
 
 
+def save_warning_geometries(db: Session, records: list[dict]) -> int:
+    """
+    Upsert many warning geometries in one statement (PostGIS only).
+
+    Args:
+        db: Database session
+        records: Dicts with warning_id, warning_number, day_number, nivel,
+            geometry (Shapely MultiPolygon), shapefile_url and shapefile_path
+
+    Returns:
+        Number of geometry records saved
+    """
+    if not settings.supports_postgis or not records:
+        return 0
+
+    now = datetime.now()
+    values = [
+        {
+            "warning_id": record["warning_id"],
+            "warning_number": record["warning_number"],
+            "day_number": record["day_number"],
+            "nivel": record["nivel"],
+            "geometry": from_shape(record["geometry"], srid=4326, extended=True),
+            "shapefile_url": record.get("shapefile_url"),
+            "shapefile_path": (
+                str(record["shapefile_path"]) if record.get("shapefile_path") else None
+            ),
+            "downloaded_at": now,
+            "updated_at": now,
+        }
+        for record in records
+    ]
+
+    # One round trip and one transaction for every day and nivel
+    stmt = pg_insert(WarningGeometry).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["warning_number", "day_number", "nivel"],
+        set_={
+            "geometry": stmt.excluded.geometry,
+            "shapefile_url": stmt.excluded.shapefile_url,
+            "shapefile_path": stmt.excluded.shapefile_path,
+            "downloaded_at": stmt.excluded.downloaded_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+    db.execute(stmt)
+    db.commit()
+    return len(values)
+
+
 def get_warning_geometries(
     db: Session, warning_id: int
 ) -> "list[WarningGeometry] | None":
@@ -154,6 +209,54 @@ def get_warning_geometry_by_number_and_day(
     )
 
 
+def get_warning_geojson_by_numbers(
+    db: Session, warning_numbers: list[str], day_number: int | None = None
+) -> list[tuple["WarningGeometry", str]]:
+    """
+    Get geometries with their GeoJSON rendered by PostGIS in one query.
+
+    Args:
+        db: Database session
+        warning_numbers: Warning numbers to fetch
+        day_number: Optional specific day (1-based)
+
+    Returns:
+        List of (WarningGeometry, GeoJSON string) tuples, ordered by
+        warning number, day and nivel
+    """
+    if not settings.supports_postgis or not warning_numbers:
+        return []
+
+    query = db.query(WarningGeometry, ST_AsGeoJSON(WarningGeometry.geometry)).filter(
+        WarningGeometry.warning_number.in_(warning_numbers),
+        WarningGeometry.geometry.isnot(None),
+    )
+    if day_number is not None:
+        query = query.filter(WarningGeometry.day_number == day_number)
+
+    return query.order_by(
+        WarningGeometry.warning_number,
+        WarningGeometry.day_number,
+        WarningGeometry.nivel,
+    ).all()
+
+
+def get_warning_numbers_with_geometry(
+    db: Session, warning_numbers: list[str]
+) -> set[str]:
+    """Get which of the given warning numbers have stored geometries."""
+    if not settings.supports_postgis or not warning_numbers:
+        return set()
+
+    rows = (
+        db.query(WarningGeometry.warning_number)
+        .filter(WarningGeometry.warning_number.in_(warning_numbers))
+        .distinct()
+        .all()
+    )
+    return {number for (number,) in rows}
+
+
 def delete_warning_geometries(db: Session, warning_id: int) -> int:
     """
     Delete all geometries for a warning.
@@ -68,6 +68,14 @@ class WarningGeometry(Base):
         __table_args__ = (
             Index("idx_warning_geometry", "geometry", postgresql_using="gist"),
             Index("idx_warning_number_day", "warning_number", "day_number"),
+            # Conflict target of the save_warning_geometries upsert
+            Index(
+                "uq_warning_geometry_number_day_nivel",
+                "warning_number",
+                "day_number",
+                "nivel",
+                unique=True,
+            ),
         )
     else:
         __table_args__ = (Index("idx_warning_day", "warning_id", "day_number"),)
@@ -1,7 +1,18 @@
 # app/storage/models.py
 from datetime import UTC, date, datetime
 
-from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String, Text, Index
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -50,11 +61,19 @@ class Location(Base):
     def __repr__(self) -> str:
         return f"<Location(id={self.id}, location='{self.location}', department='{self.department}')>"
 
-    # Spatial index (PostgreSQL only)
+    # Bounding-box prefilter and case-insensitive department lookups,
+    # plus spatial index on PostgreSQL
     if settings.supports_postgis:
         __table_args__ = (
+            Index("idx_location_lat_lon", "latitude", "longitude"),
+            Index("idx_location_department_upper", func.upper(department)),
             Index("idx_location_point", "point", postgresql_using="gist"),
         )
+    else:
+        __table_args__ = (
+            Index("idx_location_lat_lon", "latitude", "longitude"),
+            Index("idx_location_department_upper", func.upper(department)),
+        )
 
 
 class Forecast(Base):
@@ -85,6 +104,18 @@ class Forecast(Base):
     def __repr__(self) -> str:
         return f"<Forecast(id={self.id}, location_id={self.location_id}, date={self.forecast_date})>"
 
+    # Latest forecast per (location, date) lookups, and issue date checks
+    # and deletes scoped to a set of locations
+    __table_args__ = (
+        Index(
+            "idx_forecast_latest",
+            "location_id",
+            "forecast_date",
+            scraped_at.desc(),
+        ),
+        Index("idx_forecast_issued_location", "issued_at", "location_id"),
+    )
+
 
 class ScrapeRun(Base):
     """Scrape run history table."""
@@ -137,6 +168,24 @@ class WarningAlert(Base):
     def __repr__(self) -> str:
         return f"<WarningAlert(id={self.id}, senamhi_id={self.senamhi_id}, number='{self.warning_number}')>"
 
+    # One row per warning and department, target of the save_warning upsert.
+    # The partial index covers get_active_warnings without expired rows.
+    __table_args__ = (
+        Index(
+            "uq_warning_number_department",
+            "warning_number",
+            "department",
+            unique=True,
+        ),
+        Index(
+            "idx_warning_active",
+            "status",
+            "valid_until",
+            postgresql_where=text("status IN ('emitido', 'vigente')"),
+            sqlite_where=text("status IN ('emitido', 'vigente')"),
+        ),
+    )
+
 
 # Add relationship only if PostGIS is available
 if settings.supports_postgis:
@@ -1,12 +1,36 @@
 """Flask application factory."""
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+from app import serialization
+
+
+class AppJSONProvider(DefaultJSONProvider):
+    """JSON provider using orjson when available and encoding NumPy arrays."""
+
+    @staticmethod
+    def default(o):
+        """Encode NumPy values, then whatever Flask's provider supports."""
+        if hasattr(o, "tolist"):
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        if not serialization.ORJSON_AVAILABLE:
+            # Flask's stdlib encoder, which also handles dates, Decimal and UUID
+            return super().dumps(obj, **kwargs)
+        return serialization.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return serialization.loads(s)
+
 
 def create_app():
     """Create and configure Flask application."""
     app = Flask(__name__)
+    app.json = AppJSONProvider(app)
 
     CORS(app, resources={r"/api/*": {"origins": "*"}})
 
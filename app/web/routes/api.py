@@ -1,14 +1,20 @@
 """API routes for GeoJSON and geospatial data."""
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
+from openmeteo_requests import OpenMeteoRequestsError
 
+from app import serialization
 from app.database import SessionLocal
+from app.logging import setup_logging
 from app.services.geojson_service import GeoJSONService
-from app.storage.models import WarningAlert
+from app.services.openmeteo import get_openmeteo_client
+from app.storage.models import Location, WarningAlert
 from config.settings import settings
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
+logger = setup_logging(module_name="api")
+
 
 def get_geojson_service():
     """Factory function for GeoJSONService."""
@@ -16,6 +22,11 @@ def get_geojson_service():
     return GeoJSONService(db), db
 
 
+def geojson_response(geojson: dict) -> Response:
+    """JSON response serialized with orjson when available (see app.serialization)."""
+    return Response(serialization.dumps(geojson), mimetype="application/json")
+
+
 @api_bp.route("/warnings/<string:warning_number>/geometry")
 def get_warning_geometry(warning_number: str):
     """Get all geometries for a warning (all days)."""
@@ -57,7 +68,7 @@ def get_warning_geometry(warning_number: str):
         feature_count = len(geojson.get("features", []))
         print(f"API: Warning {warning_number} - Returning {feature_count} features")
 
-        return jsonify(geojson)
+        return geojson_response(geojson)
 
     finally:
         db.close()
@@ -109,7 +120,7 @@ def get_warning_geometry_day(warning_number: str, day: int):
                 }
             ), 404
 
-        return jsonify(geojson)
+        return geojson_response(geojson)
 
     finally:
         db.close()
@@ -136,8 +147,9 @@ def get_active_warnings_geometries():
     service, db = get_geojson_service()
 
     try:
-        geojson = service.get_active_warnings_geojson()
-        return jsonify(geojson)
+        # Serialized payload shared by all map clients for a short TTL
+        geojson = service.get_active_warnings_geojson_bytes()
+        return Response(geojson, mimetype="application/json")
 
     finally:
         db.close()
@@ -195,14 +207,15 @@ def get_department_geometry(department_name: str):
     from app.services.boundaries_service import BoundariesService
 
     service = BoundariesService()
-    geojson = service.get_department_geojson(department_name)
+    geojson = service.get_department_geojson_bytes(department_name)
 
     if not geojson:
         return jsonify(
             {"error": "Department not found", "department": department_name}
         ), 404
 
-    return jsonify(geojson)
+    # Serialized once per department and process
+    return Response(geojson, mimetype="application/json")
 
 
 @api_bp.route("/departments/all/geometry")
@@ -216,12 +229,13 @@ def get_all_departments_geometry():
     from app.services.boundaries_service import BoundariesService
 
     service = BoundariesService()
-    geojson = service.get_all_departments_geojson()
+    geojson = service.get_all_departments_geojson_bytes()
 
     if not geojson:
         return jsonify({"error": "Departments data not available"}), 404
 
-    return jsonify(geojson)
+    # Already serialized once per process (or prebuilt on disk)
+    return Response(geojson, mimetype="application/json")
 
 
 @api_bp.route("/warnings/<string:warning_number>/info")
@@ -265,6 +279,49 @@ def get_warning_info(warning_number: str):
         db.close()
 
 
+@api_bp.route("/locations/<int:location_id>/openmeteo")
+def get_location_openmeteo(location_id: int):
+    """
+    Stream Open Meteo hourly forecast for a location as NDJSON.
+
+    One line per model: {"model": ..., "data": {...}}.
+
+    Example:
+        GET /api/locations/1/openmeteo
+    """
+    db = SessionLocal()
+
+    try:
+        location = db.query(Location).filter(Location.id == location_id).first()
+
+        if not location or location.latitude is None or location.longitude is None:
+            return jsonify(
+                {"error": "Location coordinates not found", "location_id": location_id}
+            ), 404
+
+        latitude, longitude = location.latitude, location.longitude
+
+    finally:
+        db.close()
+
+    client = get_openmeteo_client()
+
+    def generate():
+        try:
+            for item in client.iter_hourly_forecast(latitude, longitude):
+                yield serialization.dumps(item) + b"\n"
+        except OpenMeteoRequestsError as e:
+            # Upstream request or response decoding failed (the SDK wraps both)
+            logger.warning(f"Open Meteo request failed for location {location_id}: {e}")
+            yield serialization.dumps({"error": str(e)}) + b"\n"
+        except Exception:
+            # Anything else is a bug; keep the traceback, end the stream cleanly
+            logger.exception(f"Open Meteo stream failed for location {location_id}")
+            yield serialization.dumps({"error": "Internal server error"}) + b"\n"
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
+
 @api_bp.route("/health")
 def health_check():
     """
@@ -285,6 +342,7 @@ def health_check():
                 "warning_geometry": "/api/warnings/<number>/geometry",
                 "warning_geometry_day": "/api/warnings/<number>/geometry/<day>",
                 "active_warnings": "/api/warnings/active/geometries",
+                "location_openmeteo": "/api/locations/<id>/openmeteo",
             },
         }
     )
@@ -1,7 +1,7 @@
 from flask import Blueprint, render_template
 
 from app.database import SessionLocal
-from app.services.openmeteo import OpenMeteoClient
+from app.services.openmeteo import get_openmeteo_client
 from app.storage import crud
 from config.settings import settings
 
@@ -44,8 +44,9 @@ def department(name):
         dept_name = name.upper()
 
         # Get locations for this department
-        locations = crud.get_locations(db, active_only=True)
-        dept_locations = [loc for loc in locations if loc.department == dept_name]
+        dept_locations = crud.get_locations_by_department(
+            db, dept_name, active_only=True
+        )
 
         if not dept_locations:
             return render_template(
@@ -55,57 +56,60 @@ def department(name):
         # Get active warnings for THIS department only
         active_warnings = crud.get_active_warnings(db, department=dept_name)
 
-        # Check which warnings have geometries (only if PostGIS available)
-        warnings_with_geo = []
+        # Check which warnings have geometries in one query (PostGIS only)
+        numbers_with_geo = set()
 
         if settings.supports_postgis:
-            from app.storage.geo_models import WarningGeometry
-
-            for warning in active_warnings:
-                # Check by warning_number instead of warning_id
-                warning_with_geo = (
-                    db.query(WarningGeometry)
-                    .filter(WarningGeometry.warning_number == warning.warning_number)
-                    .first()
-                )
+            from app.storage.geo_crud import get_warning_numbers_with_geometry
 
-                has_geometry = warning_with_geo is not None
+            numbers_with_geo = get_warning_numbers_with_geometry(
+                db, [w.warning_number for w in active_warnings]
+            )
 
-                warnings_with_geo.append(
-                    {"warning": warning, "has_geometry": has_geometry}
-                )
-        else:
-            warnings_with_geo = [
-                {"warning": w, "has_geometry": False} for w in active_warnings
-            ]
+        warnings_with_geo = [
+            {"warning": w, "has_geometry": w.warning_number in numbers_with_geo}
+            for w in active_warnings
+        ]
 
-        # Initialize Open Meteo client
-        openmeteo_client = OpenMeteoClient()
+        # Shared Open Meteo client
+        openmeteo_client = get_openmeteo_client()
         openmeteo_config = openmeteo_client.get_config()
 
-        # Get latest forecasts for each location + Open Meteo data
+        # Fetch Open Meteo data for all locations with coordinates at once
+        with_coords = [
+            loc
+            for loc in dept_locations
+            if loc.latitude is not None and loc.longitude is not None
+        ]
+        openmeteo_by_location = {}
+        try:
+            batch = openmeteo_client.get_hourly_forecast_batch(
+                [(loc.latitude, loc.longitude) for loc in with_coords]
+            )
+            openmeteo_by_location = {
+                loc.id: data for loc, data in zip(with_coords, batch)
+            }
+        except Exception as e:
+            print(f"Error fetching Open Meteo data for {dept_name}: {e}")
+
+        # Latest forecasts for every location in one query, grouped by location
+        forecasts_by_location = {}
+        for forecast in crud.get_latest_forecasts(
+            db, location_ids=[loc.id for loc in dept_locations]
+        ):
+            forecasts_by_location.setdefault(forecast.location_id, []).append(forecast)
+
+        # Combine with Open Meteo data
         location_forecasts = []
         for location in dept_locations:
-            forecasts = crud.get_latest_forecasts(db, location_id=location.id)
-
-            # Get Open Meteo data if coordinates available
-            openmeteo_data = None
-            if location.latitude is not None and location.longitude is not None:
-                try:
-                    openmeteo_data = openmeteo_client.get_hourly_forecast(
-                        latitude=location.latitude, longitude=location.longitude
-                    )
-                except Exception as e:
-                    print(
-                        f"Error fetching Open Meteo data for {location.location}: {e}"
-                    )
+            forecasts = forecasts_by_location.get(location.id)
 
             if forecasts:
                 location_forecasts.append(
                     {
                         "location": location,
                         "forecasts": forecasts[:3],
-                        "openmeteo": openmeteo_data,
+                        "openmeteo": openmeteo_by_location.get(location.id),
                     }
                 )
 
@@ -1,3 +1,4 @@
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -45,10 +46,16 @@ class Settings(BaseSettings):
     postgres_password: str | None = None
     postgres_db: str | None = None
 
+    # Connection pool (PostgreSQL only), sized for threaded web workers
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800
+
     # Scraping configuration
     scrape_delay: float = 2.0
     request_timeout: int = 30
     user_agent: str = "SENAMHI-Tracker/0.1.0 (Educational Project)"
+    scrape_max_workers: int = 8
 
     scrape_all_departments: bool = True
     departments: str = "LIMA"
@@ -86,6 +93,11 @@ class Settings(BaseSettings):
             return []  # Return empty list to signal "all departments"
         return [d.strip().upper() for d in self.departments.split(",")]
 
+    @cached_property
+    def departments_upper(self) -> frozenset[str]:
+        """Configured departments as an uppercase set (parsed once)."""
+        return frozenset(self.get_departments_list())
+
     @property
     def coordinates(self) -> dict[str, dict[str, list[float]]]:
         """Load and cache coordinates from YAML."""
@@ -1,8 +1,11 @@
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+
+import responses
 
 from app.scrapers.utils import parse_date, parse_temperature
 from typer.testing import CliRunner
 from app.main import app
+from config.settings import settings
 
 runner = CliRunner()
 
@@ -34,6 +37,24 @@ def test_parse_issued_date():
     assert isinstance(issued, datetime)
 
 
+def test_zip_namelist(tmp_path):
+    """Test ZIP member listing and invalid ZIP detection."""
+    import zipfile
+
+    from app.scrapers.utils import zip_namelist
+
+    archive = tmp_path / "warning.zip"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("aviso.shp", b"")
+        z.writestr("aviso.dbf", b"")
+
+    assert zip_namelist(archive) == ("aviso.shp", "aviso.dbf")
+
+    not_zip = tmp_path / "error.zip"
+    not_zip.write_text("<ServiceExceptionReport/>")
+    assert zip_namelist(not_zip) is None
+
+
 def test_scraper_integration():
     """Integration test for forecast scraper."""
     from app.scrapers.forecast_scraper import ForecastScraper
@@ -69,6 +90,100 @@ def test_scraper_multiple_departments():
     assert "LIMA" in departments_found or "CUSCO" in departments_found
 
 
+FORECAST_PAGE = """
+<html><body>
+<table class="table">
+  <tr><th>Ciudad</th></tr>
+  <tr><td>
+    <span class="nameCity">LIMA ESTE - LIMA</span>
+    <div class="row m-3">
+      <div class="col-sm-3"><strong>miércoles</strong>, 12 de noviembre</div>
+      <div class="col-sm-2"><img src="/public/images/icono/100x100/icon005.png"></div>
+      <div class="col-sm-2"><span>24ºC</span></div>
+      <div class="col-sm-2">18ºC</div>
+      <div class="col-sm-3"> Cielo nublado </div>
+    </div>
+    <div class="row m-3">
+      <div class="col-sm-3">jueves, 13 de noviembre</div>
+      <div class="col-sm-2"><img src="/public/images/icono/100x100/icon002.png"></div>
+      <div class="col-sm-2">25ºC</div>
+      <div class="col-sm-2">19ºC</div>
+      <div class="col-sm-3">Cielo despejado</div>
+    </div>
+  </td></tr>
+  <tr><td>
+    <span class="nameCity">LIMA OESTE / CALLAO - LIMA</span>
+    <div class="row m-3">
+      <div class="col-sm-3">miércoles, 12 de noviembre</div>
+      <div class="col-sm-2"></div>
+      <div class="col-sm-2">22ºC</div>
+      <div class="col-sm-2">17ºC</div>
+      <div class="col-sm-3">Llovizna</div>
+    </div>
+  </td></tr>
+  <tr><td>
+    <span class="nameCity">CUSCO - CUSCO</span>
+    <div class="row m-3">
+      <div class="col-sm-3">miércoles, 12 de noviembre</div>
+      <div class="col-sm-2"></div>
+      <div class="col-sm-2">20ºC</div>
+      <div class="col-sm-2">5ºC</div>
+      <div class="col-sm-3">Lluvia</div>
+    </div>
+  </td></tr>
+</table>
+<p>Emisión: <b>martes</b>, 11 de noviembre del 2025</p>
+</body></html>
+"""
+
+
+@responses.activate
+def test_scrape_forecasts_parses_page():
+    """Test forecast page parsing against a static page."""
+    from app.scrapers.forecast_scraper import ForecastScraper
+
+    responses.get(settings.senamhi_forecast_url, body=FORECAST_PAGE)
+
+    forecasts = ForecastScraper().scrape_forecasts(departments=["lima"])
+
+    assert [f.location for f in forecasts] == ["LIMA ESTE", "LIMA OESTE"]
+    assert forecasts[1].full_name == "LIMA OESTE / CALLAO - LIMA"
+    assert all(f.department == "LIMA" for f in forecasts)
+    assert forecasts[0].issued_at == datetime(2025, 11, 11)
+
+    first = forecasts[0].forecasts[0]
+    assert first.day_name == "miércoles"
+    assert (first.date.month, first.date.day) == (11, 12)
+    assert (first.temp_max, first.temp_min) == (24, 18)
+    assert first.icon_number == 5
+    assert first.description == "Cielo nublado"
+    assert len(forecasts[0].forecasts) == 2
+    assert forecasts[1].forecasts[0].icon_number == 0
+
+
+@responses.activate
+def test_get_all_departments_parses_page():
+    """Test department discovery against a static page."""
+    from app.scrapers.forecast_scraper import ForecastScraper
+
+    responses.get(settings.senamhi_forecast_url, body=FORECAST_PAGE)
+
+    assert ForecastScraper().get_all_departments() == ["CUSCO", "LIMA"]
+
+
+@responses.activate
+def test_scrape_all_departments_fetches_page_once():
+    """Test discovery and scraping share one page download."""
+    from app.scrapers.forecast_scraper import ForecastScraper
+
+    responses.get(settings.senamhi_forecast_url, body=FORECAST_PAGE)
+
+    forecasts = ForecastScraper().scrape_all_departments()
+
+    assert len(forecasts) == 3
+    assert len(responses.calls) == 1
+
+
 def test_scrape_help():
     """Test scrape command help."""
     result = runner.invoke(app, ["scrape", "--help"])
@@ -101,3 +216,97 @@ def test_get_all_departments():
     assert len(departments) > 0
     assert "LIMA" in departments
     assert all(dept.isupper() for dept in departments)
+
+
+def _aviso(senamhi_id: int, numero: str, titulo: str = "Lluvia moderada") -> dict:
+    """Build a warning payload shaped like the SENAMHI API response."""
+    now = datetime.now()
+    fmt = "%d/%m/%Y %H:%M:%S"
+    return {
+        "id": senamhi_id,
+        "numero": numero,
+        "titulo": titulo,
+        "descripcion": "Test",
+        "nivel": "2",
+        "colorNivel": "Amarillo",
+        "fechaEmision": (now - timedelta(hours=2)).strftime(fmt),
+        "fechaInicio": (now - timedelta(hours=1)).strftime(fmt),
+        "fechaFin": (now + timedelta(days=1)).strftime(fmt),
+    }
+
+
+@responses.activate
+def test_scrape_warnings_multiple_departments():
+    """Test warnings are fetched per department and deduplicated."""
+    from app.scrapers.warning_scraper import WarningScraper
+
+    api = settings.senamhi_warnings_api
+    responses.get(f"{api}/15", json={"Avisos": [_aviso(1, "100"), _aviso(1, "100")]})
+    responses.get(
+        f"{api}/08",
+        json={"Avisos": [_aviso(2, "100"), _aviso(3, "101", "Incendios forestales")]},
+    )
+
+    warnings = WarningScraper().scrape_warnings(departments=["LIMA", "CUSCO"])
+
+    assert len(warnings) == 2
+    assert {w.department for w in warnings} == {"LIMA", "CUSCO"}
+    assert all(w.warning_number == "100" for w in warnings)
+    assert all(w.status == "vigente" for w in warnings)
+
+
+def test_parse_warning_keeps_status_for_caller():
+    """Test expired warnings are parsed but filtered by the department scrape."""
+    from app.scrapers.warning_scraper import WarningScraper
+
+    scraper = WarningScraper()
+    expired = _aviso(4, "102")
+    expired["fechaFin"] = expired["fechaEmision"]
+
+    warning = scraper._parse_warning(expired, "LIMA")
+    assert warning is not None
+    assert warning.status == "vencido"
+
+
+def test_parse_senamhi_datetime():
+    """Test SENAMHI datetime parsing with and without zero padding."""
+    from app.scrapers.warning_scraper import WarningScraper
+
+    scraper = WarningScraper()
+    assert scraper._parse_senamhi_datetime("05/11/2025 07:30:15") == datetime(
+        2025, 11, 5, 7, 30, 15
+    )
+    assert scraper._parse_senamhi_datetime("5/11/2025 07:30:15") == datetime(
+        2025, 11, 5, 7, 30, 15
+    )
+
+
+@responses.activate
+def test_download_shapefile_rejects_non_zip(tmp_path):
+    """Test error pages are not written to disk."""
+    import io
+    import zipfile
+
+    from app.scrapers.shapefile_downloader import ShapefileDownloader
+
+    downloader = ShapefileDownloader(download_dir=tmp_path)
+
+    responses.get(
+        downloader.build_shapefile_url("418", 1, 2025),
+        body="<ServiceExceptionReport/>",
+        content_type="text/xml",
+    )
+    assert downloader.download_shapefile("418", 1, 2025) is None
+    assert list(tmp_path.iterdir()) == []
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr("aviso.shp", b"")
+    responses.get(
+        downloader.build_shapefile_url("418", 2, 2025),
+        body=buffer.getvalue(),
+        content_type="application/zip",
+    )
+    filepath = downloader.download_shapefile("418", 2, 2025)
+    assert filepath is not None
+    assert filepath.read_bytes() == buffer.getvalue()
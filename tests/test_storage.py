@@ -115,3 +115,240 @@ def test_get_latest_forecasts(db_session):
 
     assert len(forecasts) == 1
     assert forecasts[0].temp_max == 22
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_get_latest_forecasts_for_locations(db_session):
+    """Test latest forecasts for several locations come from one query."""
+    location_ids = []
+    for name, temp_max in (("CANTA", 22), ("CHOSICA", 25), ("HUARAL", 20)):
+        crud.save_forecast(
+            db_session,
+            LocationForecast(
+                location=name,
+                department="LIMA",
+                full_name=f"{name} - LIMA",
+                issued_at=datetime(2024, 11, 11),
+                forecasts=[
+                    DailyForecast(
+                        date=date(2024, 11, 12),
+                        day_name="miércoles",
+                        temp_max=temp_max,
+                        temp_min=9,
+                        icon_number=0,
+                        description="Test",
+                    )
+                ],
+            ),
+        )
+        location_ids.append(crud.get_location_by_name(db_session, name).id)
+
+    forecasts = crud.get_latest_forecasts(db_session, location_ids=location_ids[:2])
+
+    assert [f.location_id for f in forecasts] == location_ids[:2]
+    assert [f.temp_max for f in forecasts] == [22, 25]
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_departments_with_forecasts_for_issue_date(db_session):
+    """Test existing departments are found in a single lookup."""
+    issued_at = datetime(2024, 11, 11)
+    pydantic_forecast = LocationForecast(
+        location="CANTA",
+        department="LIMA",
+        full_name="CANTA - LIMA",
+        issued_at=issued_at,
+        forecasts=[
+            DailyForecast(
+                date=date(2024, 11, 12),
+                day_name="miércoles",
+                temp_max=22,
+                temp_min=9,
+                icon_number=0,
+                description="Test",
+            )
+        ],
+    )
+
+    crud.save_forecast(db_session, pydantic_forecast)
+
+    found = crud.departments_with_forecasts_for_issue_date(
+        db_session, issued_at, ["LIMA", "CUSCO"]
+    )
+    assert found == {"LIMA"}
+
+    other_issue = crud.departments_with_forecasts_for_issue_date(
+        db_session, datetime(2024, 11, 12), ["LIMA"]
+    )
+    assert other_issue == set()
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_delete_forecasts_by_issue_date_for_departments(db_session):
+    """Test forced replace deletes only the given departments."""
+    issued_at = datetime(2024, 11, 11)
+    daily = DailyForecast(
+        date=date(2024, 11, 12),
+        day_name="miércoles",
+        temp_max=22,
+        temp_min=9,
+        icon_number=0,
+        description="Test",
+    )
+    for location, department in (("CANTA", "LIMA"), ("CUSCO", "CUSCO")):
+        crud.save_forecast(
+            db_session,
+            LocationForecast(
+                location=location,
+                department=department,
+                full_name=f"{location} - {department}",
+                issued_at=issued_at,
+                forecasts=[daily],
+            ),
+        )
+
+    deleted = crud.delete_forecasts_by_issue_date(db_session, issued_at, ["lima"])
+
+    assert deleted == 1
+    remaining = crud.departments_with_forecasts_for_issue_date(
+        db_session, issued_at, ["LIMA", "CUSCO"]
+    )
+    assert remaining == {"CUSCO"}
+
+    # A single department name is not split into characters
+    deleted = crud.delete_forecasts_by_issue_date(db_session, issued_at, "CUSCO")
+
+    assert deleted == 1
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_bulk_get_or_create_locations(db_session):
+    """Test existing locations are reused and missing ones created."""
+    existing = crud.get_or_create_location(db_session, "CANTA", "LIMA", "CANTA - LIMA")
+
+    location_ids = crud.bulk_get_or_create_locations(
+        db_session,
+        [
+            ("CANTA", "LIMA", "CANTA - LIMA"),
+            ("CHOSICA", "LIMA", "CHOSICA - LIMA"),
+            ("CHOSICA", "LIMA", "CHOSICA - LIMA"),
+        ],
+    )
+
+    assert location_ids["CANTA"] == existing.id
+    assert set(location_ids) == {"CANTA", "CHOSICA"}
+    assert len(crud.get_locations(db_session)) == 2
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_bulk_get_or_create_locations_concurrent_insert(db_session):
+    """Test a location inserted by another session mid-call is reused."""
+    from sqlalchemy import event
+
+    other_ids = {}
+    fired = []
+
+    def insert_from_other_session(conn, cursor, statement, *args):
+        # Runs once, right before our INSERT, after the prefetch SELECT
+        if statement.startswith("INSERT INTO locations") and not fired:
+            fired.append(True)
+            other = TestingSessionLocal()
+            try:
+                other_ids["CHOSICA"] = crud.get_or_create_location(
+                    other, "CHOSICA", "LIMA", "CHOSICA - LIMA"
+                ).id
+            finally:
+                other.close()
+
+    event.listen(engine, "before_cursor_execute", insert_from_other_session)
+    try:
+        location_ids = crud.bulk_get_or_create_locations(
+            db_session,
+            [
+                ("CHOSICA", "LIMA", "CHOSICA - LIMA"),
+                ("CANTA", "LIMA", "CANTA - LIMA"),
+            ],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", insert_from_other_session)
+
+    assert location_ids["CHOSICA"] == other_ids["CHOSICA"]
+    assert set(location_ids) == {"CANTA", "CHOSICA"}
+    assert len(crud.get_locations(db_session)) == 2
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_get_locations_by_department(db_session):
+    """Test department filter runs case-insensitively in SQL."""
+    crud.get_or_create_location(db_session, "CANTA", "LIMA", "CANTA - LIMA")
+    crud.get_or_create_location(db_session, "CUSCO", "CUSCO", "CUSCO - CUSCO")
+
+    locations = crud.get_locations_by_department(db_session, "lima")
+
+    assert [loc.location for loc in locations] == ["CANTA"]
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_scrape_transaction_rolls_back_on_error(db_session):
+    """Test uncommitted helper writes are discarded when the block fails."""
+    from app.database import scrape_transaction
+
+    with pytest.raises(RuntimeError), scrape_transaction(db_session):
+        crud.bulk_get_or_create_locations(
+            db_session, [("CANTA", "LIMA", "CANTA - LIMA")], commit=False
+        )
+        raise RuntimeError("scrape failed")
+
+    assert crud.get_locations(db_session) == []
+
+    with scrape_transaction(db_session):
+        crud.bulk_get_or_create_locations(
+            db_session, [("CANTA", "LIMA", "CANTA - LIMA")], commit=False
+        )
+
+    assert [loc.location for loc in crud.get_locations(db_session)] == ["CANTA"]
+
+
+@pytest.mark.skipif(
+    settings.supports_postgis, reason="PostGIS available, skip SQLite tests"
+)
+def test_save_forecast_without_commit_creates_location_uncommitted(db_session):
+    """Test save_forecast(commit=False) does not commit the new location."""
+    from app.database import scrape_transaction
+
+    forecast = LocationForecast(
+        location="CANTA",
+        department="LIMA",
+        full_name="CANTA - LIMA",
+        issued_at=datetime(2024, 11, 11),
+        forecasts=[
+            DailyForecast(
+                date=date(2024, 11, 12),
+                day_name="miércoles",
+                temp_max=22,
+                temp_min=9,
+                icon_number=0,
+                description="Test",
+            )
+        ],
+    )
+
+    with pytest.raises(RuntimeError), scrape_transaction(db_session):
+        crud.save_forecast(db_session, forecast, commit=False)
+        raise RuntimeError("scrape failed")
+
+    assert crud.get_locations(db_session) == []
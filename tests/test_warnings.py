@@ -115,6 +115,36 @@ class TestWarningAlerts:
         assert len(lima_warnings) == 1
         assert lima_warnings[0].department == "LIMA"
 
+    def test_get_active_warnings_order(self, db_session):
+        """Test VIGENTE warnings come first, then the closest start time."""
+        now = datetime.now()
+
+        def make(number, status, starts_in):
+            return Warning(
+                senamhi_id=int(number),
+                warning_number=number,
+                department="LIMA",
+                severity=WarningSeverity.YELLOW,
+                status=status,
+                title="Order Warning",
+                description="Test",
+                valid_from=now + starts_in,
+                valid_until=now + timedelta(days=3),
+                issued_at=now,
+            )
+
+        for warning in (
+            make("010", WarningStatus.EMITIDO, timedelta(hours=2)),
+            make("011", WarningStatus.VIGENTE, -timedelta(hours=5)),
+            make("012", WarningStatus.EMITIDO, timedelta(days=1)),
+            make("013", WarningStatus.VIGENTE, -timedelta(hours=1)),
+        ):
+            crud.save_warning(db_session, warning)
+
+        ordered = crud.get_active_warnings(db_session)
+
+        assert [w.warning_number for w in ordered] == ["013", "011", "010", "012"]
+
     def test_same_warning_different_departments(self, db_session):
         """Test that same warning number can exist for different departments."""
         now = datetime.now()
@@ -192,3 +222,32 @@ class TestWarningAlerts:
         statuses = [w.status for w in active_warnings]
         assert "emitido" in statuses
         assert "vigente" in statuses
+
+    def test_save_warnings_upserts_in_batch(self, db_session):
+        """Test batch save inserts new warnings and updates existing ones."""
+        now = datetime.now()
+
+        def make(number: str, department: str, title: str) -> Warning:
+            return Warning(
+                senamhi_id=int(number),
+                warning_number=number,
+                department=department,
+                severity=WarningSeverity.YELLOW,
+                status=WarningStatus.VIGENTE,
+                title=title,
+                description="Test",
+                valid_from=now,
+                valid_until=now + timedelta(days=1),
+                issued_at=now,
+            )
+
+        crud.save_warning(db_session, make("200", "LIMA", "Original"))
+
+        batch = [make("200", "LIMA", "Updated"), make("201", "CUSCO", "New")]
+        existing = crud.get_existing_warning_keys(db_session, batch)
+        saved = crud.save_warnings(db_session, batch)
+
+        assert existing == {("200", "LIMA")}
+        assert saved == 2
+        assert crud.get_warning_by_number(db_session, "200", "LIMA").title == "Updated"
+        assert crud.get_warning_by_number(db_session, "201", "CUSCO") is not None
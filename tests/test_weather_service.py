@@ -1,5 +1,7 @@
 """Integration tests for WeatherService."""
 
+import time
+
 import pytest
 from app.storage import crud
 from config.settings import settings
@@ -72,6 +74,51 @@ class TestWeatherServiceForecasts:
         locations = weather_service.get_all_locations()
         assert len(locations) == 1
 
+    def test_update_forecasts_skips_existing_issue(
+        self, weather_service, sample_forecast_data, monkeypatch
+    ):
+        """Test a repeated scrape of the same issue is skipped without a query."""
+        from app.services import weather_service as service_module
+
+        monkeypatch.setattr(service_module, "_existing_issues", {})
+        monkeypatch.setattr(
+            weather_service.forecast_scraper,
+            "scrape_forecasts",
+            lambda departments: [sample_forecast_data],
+        )
+
+        first = weather_service.update_forecasts(departments=["LIMA"])
+        assert first["success"] is True
+        assert first["saved"] == 2
+
+        def fail(*args, **kwargs):
+            raise AssertionError("existence should come from the cache")
+
+        monkeypatch.setattr(crud, "departments_with_forecasts_for_issue_date", fail)
+
+        second = weather_service.update_forecasts(departments=["LIMA"])
+        assert second["skipped"] is True
+
+        # Requested department case does not matter
+        third = weather_service.update_forecasts(departments=["lima"])
+        assert third["skipped"] is True
+
+    def test_mark_issue_seen_prunes_expired(self, monkeypatch):
+        """Test expired existence entries are dropped when new ones are added."""
+        from app.services import weather_service as service_module
+
+        issued_at = datetime(2025, 11, 18)
+        monkeypatch.setattr(
+            service_module,
+            "_existing_issues",
+            {("db", issued_at, "CUSCO"): time.monotonic() - 10_000},
+        )
+
+        service_module._mark_issue_seen("db", issued_at, ["lima"])
+
+        assert list(service_module._existing_issues) == [("db", issued_at, "LIMA")]
+        assert service_module._issue_seen("db", issued_at, "Lima")
+
 
 @pytest.mark.skipif(
     settings.supports_postgis, reason="PostGIS available, skip SQLite tests"